@@ -0,0 +1,56 @@
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from src.assets import sync_assets
+
+
+def write_assets(static_dir, files, size, seed):
+    rng = random.Random(seed)
+    for index in range(files):
+        path = os.path.join(static_dir, f"dir{index % 50}", f"image{index}.png")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(rng.randbytes(rng.randint(size // 2, size * 2)))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare asset sync with deleting and recopying static/")
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=16 * 1024, help="average file size in bytes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        static = os.path.join(tmp, "static")
+        write_assets(static, args.files, args.size, args.seed)
+
+        naive = os.path.join(tmp, "naive")
+        shutil.copytree(static, naive)
+        elapsed, _ = timed(lambda: (shutil.rmtree(naive), shutil.copytree(static, naive)))
+        print(f"delete and recopy: {elapsed:.2f}s")
+
+        output = os.path.join(tmp, "public")
+        for label, options in (("copy", {}), ("hardlink", {"hardlink": True})):
+            shutil.rmtree(output, ignore_errors=True)
+            elapsed, report = timed(lambda: sync_assets(static, output, **options))
+            print(f"sync ({label}), first run: {elapsed:.2f}s, {report['bytes_copied'] / 2**20:.1f} MiB copied")
+        elapsed, report = timed(lambda: sync_assets(static, output))
+        print(f"sync, nothing changed: {elapsed:.2f}s, {report['bytes_skipped'] / 2**20:.1f} MiB skipped")
+        touched = os.path.join(static, "dir0", "image0.png")
+        with open(touched, "ab") as f:
+            f.write(b"x")
+        elapsed, report = timed(lambda: sync_assets(static, output))
+        print(f"sync, one file changed: {elapsed:.2f}s, {report['copied']} copied")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import builtins
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from benchmarks import corpus
+from benchmarks.bench_build import tree_digest
+from src import async_build, build
+from src.async_build import build_site_concurrent
+from src.build import build_site
+
+
+@contextmanager
+def io_latency(seconds):
+    # Local shim for a network volume: every open() in the build modules
+    # waits first. Module globals shadow the builtin, so nothing else in
+    # the process is slowed down.
+    def slow_open(*args, **kwargs):
+        time.sleep(seconds)
+        return builtins.open(*args, **kwargs)
+
+    modules = (build, async_build)
+    for module in modules:
+        module.open = slow_open
+    try:
+        yield
+    finally:
+        for module in modules:
+            del module.open
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sequential and async builds with injected I/O latency")
+    parser.add_argument("--pages", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds added to every file open")
+    parser.add_argument("--readers", type=int, default=32)
+    parser.add_argument("--writers", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        content = os.path.join(tmp, "content")
+        corpus.write_pages(content, corpus.many_tiny(corpus.make_rng(args.seed), args.pages))
+        sequential = os.path.join(tmp, "sequential")
+        concurrent = os.path.join(tmp, "async")
+        with io_latency(args.latency):
+            start = time.perf_counter()
+            build_site(content, sequential)
+            sequential_time = time.perf_counter() - start
+            start = time.perf_counter()
+            build_site_concurrent(content, concurrent, readers=args.readers, writers=args.writers)
+            async_time = time.perf_counter() - start
+        print(f"{args.pages} pages, {args.latency * 1000:.1f} ms per open")
+        print(f"sequential: {sequential_time:.2f}s")
+        print(f"async:      {async_time:.2f}s ({sequential_time / async_time:.1f}x)")
+        print("output identical:", tree_digest(sequential) == tree_digest(concurrent))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from benchmarks import corpus
+from src.build import build_site
+
+
+def tree_digest(output_dir):
+    digest = hashlib.sha256()
+    for root, _, files in sorted(os.walk(output_dir)):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, output_dir).encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report build throughput at several worker counts")
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        content = os.path.join(tmp, "content")
+        corpus.write_pages(content, corpus.site_pages(corpus.make_rng(args.seed), args.pages))
+        digests = set()
+        for workers in args.workers:
+            output = os.path.join(tmp, f"public{workers}")
+            start = time.perf_counter()
+            build_site(content, output, workers=workers)
+            elapsed = time.perf_counter() - start
+            digests.add(tree_digest(output))
+            print(f"workers={workers}: {args.pages / elapsed:8.0f} pages/s")
+        print("output identical across worker counts:", len(digests) == 1)
+
+
+if __name__ == "__main__":
+    main()
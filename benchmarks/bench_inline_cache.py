@@ -0,0 +1,41 @@
+import argparse
+import os
+import tempfile
+import time
+from benchmarks import corpus
+from benchmarks.bench_build import tree_digest
+from src.build import build_site
+from src.inline_cache import InlineRenderCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare builds with and without the inline render cache")
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--repeat-rate", type=float, default=0.4, help="share of inline fragments drawn from boilerplate")
+    parser.add_argument("--entries", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        content = os.path.join(tmp, "content")
+        corpus.write_pages(content, corpus.repetitive_pages(corpus.make_rng(args.seed), args.pages, args.repeat_rate))
+
+        output = os.path.join(tmp, "plain")
+        start = time.perf_counter()
+        build_site(content, output)
+        plain = time.perf_counter() - start
+        print(f"no cache:     {plain:.2f}s")
+
+        cached_output = os.path.join(tmp, "cached")
+        cache = InlineRenderCache(args.entries)
+        start = time.perf_counter()
+        build_site(content, cached_output, inline_cache=cache)
+        cached = time.perf_counter() - start
+        stats = cache.stats()
+        print(f"inline cache: {cached:.2f}s ({plain / cached:.2f}x), "
+              f"{stats['hits']} hits, {stats['misses']} misses, hit rate {stats['hit_rate']:.0%}")
+        print("output identical:", tree_digest(output) == tree_digest(cached_output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import gc
+import tracemalloc
+from src.textnode import TextNode, TextType
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+
+
+# Dict-backed copies of the node classes as they were before __slots__,
+# used as the "before" side of the comparison.
+class DictTextNode:
+    def __init__(self, text, text_type, url=None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+
+class DictHTMLNode:
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+
+class DictLeafNode(DictHTMLNode):
+    def __init__(self, tag, value, props=None):
+        super().__init__(tag, value, None, props)
+
+
+class DictParentNode(DictHTMLNode):
+    def __init__(self, tag, children, props=None):
+        super().__init__(tag, None, children, props)
+
+
+def build_document(node_count, text_cls, leaf_cls, parent_cls):
+    # Each paragraph contributes 9 nodes: 4 TextNodes, 4 LeafNodes and its
+    # ParentNode, plus one section ParentNode per 100 paragraphs. Strings are shared so only
+    # the node objects themselves are measured.
+    texts = []
+    paragraphs = []
+    for _ in range(node_count // 9):
+        texts.append(text_cls("plain ", TextType.TEXT))
+        texts.append(text_cls("bold", TextType.BOLD))
+        texts.append(text_cls("link", TextType.LINK, "/url"))
+        texts.append(text_cls("tail", TextType.TEXT))
+        paragraphs.append(parent_cls("p", [
+            leaf_cls(None, "plain "),
+            leaf_cls("b", "bold"),
+            leaf_cls("a", "link"),
+            leaf_cls(None, "tail"),
+        ]))
+    sections = [parent_cls("section", paragraphs[i:i + 100]) for i in range(0, len(paragraphs), 100)]
+    return texts, parent_cls("div", sections)
+
+
+def count_nodes(document):
+    texts, root = document
+    count = len(texts)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if node.children:
+            stack.extend(node.children)
+    return count
+
+
+def measure(node_count, classes):
+    gc.collect()
+    tracemalloc.start()
+    document = build_document(node_count, *classes)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, count_nodes(document)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report bytes per node for dict-backed and slotted nodes")
+    parser.add_argument("--nodes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    before, nodes = measure(args.nodes, (DictTextNode, DictLeafNode, DictParentNode))
+    after, _ = measure(args.nodes, (TextNode, LeafNode, ParentNode))
+    print(f"nodes: {nodes}")
+    print(f"before (__dict__): {before / nodes:6.1f} bytes/node  {before / 2**20:7.1f} MiB")
+    print(f"after (__slots__): {after / nodes:6.1f} bytes/node  {after / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
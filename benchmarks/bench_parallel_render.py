@@ -0,0 +1,33 @@
+import argparse
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks import corpus
+from src.block_parser import markdown_to_html_node
+from src.parallel_render import markdown_to_html_node_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render one huge markdown file on one core and in chunks")
+    parser.add_argument("--size", type=int, default=50, help="document size in MiB")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=1024, help="chunk size in KiB")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    markdown = corpus.huge_single(corpus.make_rng(args.seed), args.size * 1024 * 1024)
+    start = time.perf_counter()
+    expected = hashlib.sha256(markdown_to_html_node(markdown).to_html().encode()).hexdigest()
+    single = time.perf_counter() - start
+    print(f"{args.size} MiB, single process: {single:.2f}s")
+    for workers in args.workers:
+        with ProcessPoolExecutor(workers) as executor:
+            start = time.perf_counter()
+            html = markdown_to_html_node_parallel(markdown, executor, args.chunk_size * 1024).to_html()
+            elapsed = time.perf_counter() - start
+        identical = hashlib.sha256(html.encode()).hexdigest() == expected
+        print(f"workers={workers}: {elapsed:.2f}s ({single / elapsed:.2f}x), output identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import timeit
+from src.htmlnode import HTMLNode
+
+
+def unescaped_props_to_html(props):
+    # props_to_html as it was before escaping was added.
+    if not props:
+        return ""
+    out_str = ""
+    for key, value in props.items():
+        out_str += f' {key}="{value}"'
+    return out_str
+
+
+CASES = {
+    "link": {"href": "https://www.boot.dev/lessons/1234"},
+    "image": {"src": "/images/diagram.png", "alt": "Architecture diagram"},
+    "nav": {"href": "/docs/", "class": "nav-link", "id": "nav-docs"},
+    "escaped": {"href": "/search?q=a&page=2", "title": 'say "hi"'},
+}
+
+
+def best_per_call(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def distinct_nodes(count):
+    # One href per page, so nothing repeats between calls.
+    return [HTMLNode("a", "x", None, {"href": f"https://www.boot.dev/docs/page/{i}"}) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare escaped props_to_html against the old unescaped path")
+    parser.add_argument("--number", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--distinct", type=int, default=100000)
+    args = parser.parse_args()
+
+    for name, props in CASES.items():
+        node = HTMLNode("a", "x", None, props)
+        old_node = HTMLNode("a", "x", None, props)
+        old = best_per_call(lambda: unescaped_props_to_html(old_node.props), args.number, args.repeat)
+        new = best_per_call(node.props_to_html, args.number, args.repeat)
+        print(f"{name:>8}: unescaped {old * 1e9:6.0f} ns/call  escaped {new * 1e9:6.0f} ns/call")
+
+    nodes = distinct_nodes(args.distinct)
+    old = best_per_call(lambda: [unescaped_props_to_html(node.props) for node in nodes], 1, args.repeat) / len(nodes)
+    new = best_per_call(lambda: [node.props_to_html() for node in nodes], 1, args.repeat) / len(nodes)
+    print(f"{'distinct':>8}: unescaped {old * 1e9:6.0f} ns/call  escaped {new * 1e9:6.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import time
+from benchmarks.corpus import deep_tree, wide_tree
+from src.htmlnode import HTMLNode
+from src.parentnode import ParentNode
+
+
+def recursive_to_html(node):
+    # The pre-streaming ParentNode.to_html, kept as the reference point.
+    if not isinstance(node, ParentNode):
+        return node.to_html()
+    if not node.tag:
+        raise ValueError("invalid HTML: no tag")
+    if not node.children:
+        raise ValueError("invalid HTML: no children")
+    children_html = "".join(
+        recursive_to_html(child) if isinstance(child, HTMLNode) else str(child)
+        for child in node.children
+    )
+    return f"<{node.tag}{node.props_to_html()}>{children_html}</{node.tag}>"
+
+
+def best_of(func, node, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        html = func(node)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare recursive and iterative HTML rendering")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--depth", type=int, default=100000)
+    args = parser.parse_args()
+
+    cases = [
+        ("wide", wide_tree(200, 200), True),
+        ("deep-200", deep_tree(200), True),
+        (f"deep-{args.depth}", deep_tree(args.depth), False),
+    ]
+    for name, node, run_recursive in cases:
+        iterative, size = best_of(lambda n: n.to_html(), node, args.repeat)
+        line = f"{name:>14}: iterative {size / iterative / 1e6:8.1f} MB/s"
+        if run_recursive:
+            recursive, _ = best_of(recursive_to_html, node, args.repeat)
+            line += f"  recursive {size / recursive / 1e6:8.1f} MB/s"
+        else:
+            line += "  recursive  (exceeds recursion limit)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
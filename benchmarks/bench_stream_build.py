@@ -0,0 +1,66 @@
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks import corpus
+
+
+def peak_rss_kib():
+    # ru_maxrss is carried over from the parent through fork and exec on
+    # Linux, so the kernel's high-water mark for this process is preferred.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child(mode, content, output):
+    # Runs one build in this process and reports its peak RSS in KiB.
+    start = time.perf_counter()
+    if mode == "stream":
+        from src.stream_build import stream_build_site
+        stream_build_site(content, output)
+    else:
+        from src.build import build_site
+        build_site(content, output)
+    elapsed = time.perf_counter() - start
+    print(peak_rss_kib(), elapsed)
+
+
+def measure(mode, content, output):
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_stream_build", "--child", mode, content, output],
+        check=True, capture_output=True, text=True,
+    )
+    rss, elapsed = result.stdout.split()
+    return int(rss) / 1024, float(elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS of the default and streaming builds as page count grows")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "CONTENT", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    for pages in args.pages:
+        with tempfile.TemporaryDirectory() as tmp:
+            content = os.path.join(tmp, "content")
+            corpus.write_pages(content, corpus.many_tiny(corpus.make_rng(args.seed), pages))
+            for mode in ("default", "stream"):
+                rss, elapsed = measure(mode, content, os.path.join(tmp, mode))
+                print(f"{pages:7} pages  {mode:8} peak RSS {rss:7.1f} MiB  {elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import hashlib
+import time
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+from src.subtree_cache import cache_html
+
+
+def layout(links):
+    nav = ParentNode("nav", [
+        ParentNode("ul", [ParentNode("li", [LeafNode("a", f"Page {i}", {"href": f"/page{i}.html"})]) for i in range(links)])
+    ], {"class": "site-nav"})
+    footer = ParentNode("footer", [LeafNode("p", "Built with the static site generator"), LeafNode("a", "Top", {"href": "#"})])
+    return nav, footer
+
+
+def render_pages(pages, nav, footer):
+    digest = hashlib.sha256()
+    for index in range(pages):
+        page = ParentNode("body", [nav, ParentNode("main", [LeafNode("h1", f"Page {index}"), LeafNode("p", "text")]), footer])
+        digest.update(page.to_html().encode())
+    return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render pages sharing a navigation subtree, with and without caching")
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--links", type=int, default=100)
+    args = parser.parse_args()
+
+    nav, footer = layout(args.links)
+    start = time.perf_counter()
+    plain = render_pages(args.pages, nav, footer)
+    uncached = time.perf_counter() - start
+
+    nav, footer = layout(args.links)
+    nav = cache_html(nav)
+    footer = cache_html(footer)
+    start = time.perf_counter()
+    cached_digest = render_pages(args.pages, nav, footer)
+    cached = time.perf_counter() - start
+
+    print(f"uncached: {uncached:.2f}s")
+    print(f"cached:   {cached:.2f}s ({uncached / cached:.1f}x)")
+    print("output identical:", plain == cached_digest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import os
+import random
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+
+# Seeded synthetic markdown. Everything generated here is valid for the
+# parser: delimiters are balanced and URLs contain no "_", so the legacy
+# split_nodes_delimiter chain can process the same text.
+
+WORDS = (
+    "static site node markdown render page build tree html text parser "
+    "block inline link image code bold italic template output content"
+).split()
+
+
+def sentence(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def inline_text(rng, words, links=1):
+    parts = [sentence(rng, words)]
+    for _ in range(links):
+        parts.append(f"[{rng.choice(WORDS)}](/docs/{rng.choice(WORDS)}/{rng.randint(0, 999)})")
+        parts.append(f"**{rng.choice(WORDS)}** and _{rng.choice(WORDS)}_ then `{rng.choice(WORDS)}()`")
+    return " ".join(parts)
+
+
+def link_heavy(rng, paragraphs=60, links_per_paragraph=40):
+    blocks = ["# Link heavy"]
+    for _ in range(paragraphs):
+        links = " ".join(
+            f"[{rng.choice(WORDS)}](https://example.com/{rng.choice(WORDS)}/{rng.randint(0, 9999)})"
+            f" ![{rng.choice(WORDS)}](/img/{rng.randint(0, 99)}.png)"
+            for _ in range(links_per_paragraph)
+        )
+        blocks.append(links)
+    return "\n\n".join(blocks) + "\n"
+
+
+def deeply_nested(rng, blocks=150, depth=40):
+    # Nested quote markers and long lists, the deepest shapes the block
+    # parser understands.
+    out = ["# Deeply nested"]
+    for index in range(blocks):
+        if index % 2:
+            out.append("\n".join(">" * rng.randint(1, depth) + " " + inline_text(rng, 8) for _ in range(depth)))
+        else:
+            out.append("\n".join(f"- {inline_text(rng, 6)}" for _ in range(depth)))
+    return "\n\n".join(out) + "\n"
+
+
+def huge_single(rng, size=4 * 1024 * 1024):
+    blocks = ["# Huge page"]
+    total = 0
+    while total < size:
+        kind = rng.randrange(5)
+        if kind == 0:
+            block = f"## {sentence(rng, 4)}"
+        elif kind == 1:
+            block = "```\n" + "\n".join(f"x = {rng.randint(0, 9)} < y" for _ in range(8)) + "\n```"
+        elif kind == 2:
+            block = "\n".join(f"{number}. {inline_text(rng, 6)}" for number in range(1, 8))
+        else:
+            block = inline_text(rng, 40, links=3)
+        blocks.append(block)
+        total += len(block) + 2
+    return "\n\n".join(blocks) + "\n"
+
+
+def many_tiny(rng, count=2000):
+    pages = {}
+    for index in range(count):
+        body = "\n\n".join(inline_text(rng, 12) for _ in range(rng.randint(1, 4)))
+        pages[os.path.join(f"section{index % 20}", f"page{index}.md")] = f"# Page {index}\n\n{body}\n"
+    return pages
+
+
+def site_pages(rng, count=2000):
+    # Medium-sized pages: several paragraphs plus a list each.
+    pages = {}
+    for index in range(count):
+        paragraphs = [inline_text(rng, rng.randint(20, 60)) for _ in range(rng.randint(3, 12))]
+        items = "\n".join(f"- item `{j}`" for j in range(rng.randint(2, 8)))
+        body = "\n\n".join(paragraphs)
+        pages[os.path.join(f"section{index % 20}", f"page{index}.md")] = f"# Page {index}\n\n{body}\n\n{items}\n"
+    return pages
+
+
+def repetitive_pages(rng, count=2000, repeat_rate=0.4, fragments=200):
+    # Pages where about repeat_rate of the inline fragments (list items,
+    # breadcrumbs, admonitions) come from a shared pool of boilerplate.
+    pool = [inline_text(rng, rng.randint(3, 12)) for _ in range(fragments)]
+
+    def fragment(words):
+        if rng.random() < repeat_rate:
+            return rng.choice(pool)
+        return inline_text(rng, words)
+
+    pages = {}
+    for index in range(count):
+        breadcrumb = f"[Home](/) / [{rng.choice(WORDS)}](/{rng.choice(WORDS)})"
+        paragraphs = [fragment(rng.randint(20, 50)) for _ in range(rng.randint(2, 6))]
+        items = "\n".join(f"- {fragment(6)}" for _ in range(rng.randint(3, 10)))
+        body = "\n\n".join([breadcrumb] + paragraphs + [items])
+        pages[os.path.join(f"section{index % 20}", f"page{index}.md")] = f"# Page {index}\n\n{body}\n"
+    return pages
+
+
+def write_pages(directory, pages):
+    for page, markdown in pages.items():
+        path = os.path.join(directory, page)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(markdown)
+
+
+def deep_tree(depth):
+    node = LeafNode("b", "x")
+    for _ in range(depth):
+        node = ParentNode("blockquote", [node])
+    return node
+
+
+def wide_tree(sections, items):
+    return ParentNode("div", [
+        ParentNode("section", [
+            ParentNode("p", [LeafNode(None, "item "), LeafNode("b", str(i)), LeafNode("a", "link", {"href": "/x"})])
+            for i in range(items)
+        ], {"class": "s"})
+        for _ in range(sections)
+    ])
+
+
+def make_rng(seed):
+    return random.Random(seed)
@@ -0,0 +1,160 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from benchmarks import corpus
+from src.block_parser import BlockType, iter_blocks, markdown_to_html_node
+from src.build import build_site
+from src.inline_tokenizer import text_to_textnodes
+from src.textnode import TextNode, TextType
+from src.util_functions import (
+    split_nodes_delimiter,
+    split_nodes_image,
+    split_nodes_link,
+    text_nodes_to_html_nodes,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def inline_blocks(markdown):
+    return [block.replace("\n", " ") for block_type, block in iter_blocks(markdown.split("\n")) if block_type != BlockType.CODE]
+
+
+def legacy_split_chain(texts):
+    for text in texts:
+        nodes = [TextNode(text, TextType.TEXT)]
+        nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+        nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
+        nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+        split_nodes_link(split_nodes_image(nodes))
+
+
+def collect_props_nodes(root):
+    nodes = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.props:
+            nodes.append(node)
+        if node.children:
+            stack.extend(node.children)
+    return nodes
+
+
+def document_stages(name, markdown, repeat):
+    texts = inline_blocks(markdown)
+    text_nodes = [text_to_textnodes(text) for text in texts]
+    root = markdown_to_html_node(markdown)
+    props_nodes = collect_props_nodes(root)
+    return {
+        f"{name}/legacy_split_chain": best_time(lambda: legacy_split_chain(texts), repeat),
+        f"{name}/text_to_textnodes": best_time(lambda: [text_to_textnodes(text) for text in texts], repeat),
+        f"{name}/text_node_to_html_node": best_time(lambda: [list(text_nodes_to_html_nodes(nodes)) for nodes in text_nodes], repeat),
+        f"{name}/parse": best_time(lambda: markdown_to_html_node(markdown), repeat),
+        f"{name}/to_html": best_time(root.to_html, repeat),
+        f"{name}/props_to_html": best_time(lambda: [node.props_to_html() for node in props_nodes], repeat),
+    }
+
+
+def build_stage(name, pages, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        content = os.path.join(tmp, "content")
+        corpus.write_pages(content, pages)
+        output = os.path.join(tmp, "public")
+        return {f"{name}/build": best_time(lambda: build_site(content, output, workers=1), repeat)}
+
+
+def run_suite(seed, scale, repeat):
+    rng = corpus.make_rng(seed)
+    results = {}
+    documents = {
+        "link_heavy": corpus.link_heavy(rng, paragraphs=max(1, int(60 * scale))),
+        "deeply_nested": corpus.deeply_nested(rng, blocks=max(1, int(150 * scale))),
+        "huge_single": corpus.huge_single(rng, size=int(4 * 1024 * 1024 * scale)),
+    }
+    for name, markdown in documents.items():
+        results.update(document_stages(name, markdown, repeat))
+
+    deep = corpus.deep_tree(max(1, int(100000 * scale)))
+    results["deep_tree/to_html"] = best_time(deep.to_html, repeat)
+    wide = corpus.wide_tree(max(1, int(200 * scale)), 200)
+    results["wide_tree/to_html"] = best_time(wide.to_html, repeat)
+
+    results.update(build_stage("many_tiny", corpus.many_tiny(rng, count=max(1, int(2000 * scale))), repeat))
+    results.update(build_stage("huge_single", {"huge.md": documents["huge_single"]}, repeat))
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:40} {seconds * 1000:10.2f} ms  (no baseline)")
+            continue
+        change = (seconds / base - 1) * 100
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:40} {seconds * 1000:10.2f} ms  {change:+7.1f}%{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each pipeline stage on synthetic corpora")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for corpus sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="write results JSON here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=20.0, help="allowed slowdown in percent")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.seed, args.scale, args.repeat)
+    report = {
+        "meta": {"seed": args.seed, "scale": args.scale, "python": platform.python_version()},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {"meta": report["meta"], "results": {}}
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+    if baseline["meta"] != report["meta"]:
+        print(f"warning: baseline was recorded with {baseline['meta']}")
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"{len(regressions)} stage(s) slower than baseline by more than {args.threshold}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
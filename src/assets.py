@@ -0,0 +1,303 @@
+from concurrent.futures import ThreadPoolExecutor
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+import hashlib
+import json
+import os
+import shutil
+
+ASSET_MANIFEST_NAME = ".asset-manifest.json"
+ASSET_MANIFEST_VERSION = 2
+FINGERPRINT_LENGTH = 6
+URL_PROPS = ("src", "href")
+COPY_CHUNK = 8 * 1024 * 1024
+TEMP_SUFFIX = ".sync-tmp"
+
+
+def find_assets(static_dir):
+    assets = []
+    for root, _, files in os.walk(static_dir):
+        for name in files:
+            assets.append(os.path.relpath(os.path.join(root, name), static_dir))
+    return sorted(assets)
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(COPY_CHUNK)
+            if not data:
+                break
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def fingerprint_name(asset, digest):
+    # images/logo.png -> images/logo.3f9a1c.png
+    root, extension = os.path.splitext(asset)
+    return f"{root}.{digest[:FINGERPRINT_LENGTH]}{extension}"
+
+
+def _copy_file_range(source, destination, size):
+    copied = 0
+    while copied < size:
+        count = os.copy_file_range(source.fileno(), destination.fileno(), size - copied)
+        if count == 0:
+            break
+        copied += count
+    return copied
+
+
+def _sendfile(source, destination, size):
+    copied = 0
+    while copied < size:
+        count = os.sendfile(destination.fileno(), source.fileno(), copied, size - copied)
+        if count == 0:
+            break
+        copied += count
+    return copied
+
+
+_KERNEL_COPIES = tuple(
+    copy for name, copy in (("copy_file_range", _copy_file_range), ("sendfile", _sendfile)) if hasattr(os, name)
+)
+
+
+def _copy_contents(source_path, destination_path):
+    # In-kernel copies first: copy_file_range can share extents on
+    # filesystems that support it, sendfile still avoids copying through
+    # user space. Either may be missing or refuse a pair of files, in which
+    # case the next method is tried from the start.
+    with open(source_path, "rb") as source, open(destination_path, "wb") as destination:
+        size = os.fstat(source.fileno()).st_size
+        for copy in _KERNEL_COPIES:
+            try:
+                if copy(source, destination, size) == size:
+                    return
+            except OSError:
+                pass
+            source.seek(0)
+            destination.seek(0)
+            destination.truncate()
+        shutil.copyfileobj(source, destination, COPY_CHUNK)
+
+
+def copy_asset(source_path, destination_path, hardlink=False):
+    # The new file is put in place with os.replace, so a reader never sees
+    # a partly copied asset. A hardlink shares the source's inode, which
+    # costs no space or time but means an in-place edit of either file
+    # changes both; it falls back to copying across filesystems.
+    os.makedirs(os.path.dirname(destination_path) or ".", exist_ok=True)
+    temp_path = destination_path + TEMP_SUFFIX
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    try:
+        if hardlink:
+            try:
+                os.link(source_path, temp_path)
+            except OSError:
+                _copy_contents(source_path, temp_path)
+        else:
+            _copy_contents(source_path, temp_path)
+        os.replace(temp_path, destination_path)
+    except BaseException:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_asset_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != ASSET_MANIFEST_VERSION:
+        return {}
+    return manifest["assets"]
+
+
+def save_asset_manifest(manifest_path, assets):
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": ASSET_MANIFEST_VERSION, "assets": assets}, f, indent=1, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+
+def _remove_empty_dirs(directory, stop):
+    stop = os.path.abspath(stop)
+    directory = os.path.abspath(directory)
+    while directory != stop and directory.startswith(stop + os.sep):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            return
+        directory = os.path.dirname(directory)
+
+
+def link_fingerprinted(plain_path, fingerprinted_path):
+    # The fingerprinted name is another link to the plain copy, so it takes
+    # no extra space.
+    if os.path.exists(fingerprinted_path):
+        return
+    try:
+        os.link(plain_path, fingerprinted_path)
+    except OSError:
+        copy_asset(plain_path, fingerprinted_path)
+
+
+def sync_assets(static_dir, output_dir, manifest_path=None, use_hash=False, hardlink=False, workers=8,
+                fingerprint=False):
+    # Mirrors static_dir into output_dir. The manifest keeps each asset's
+    # size and mtime (and content hash with use_hash); an asset is copied
+    # only if these changed or its copy in output_dir is missing or has the
+    # wrong size. With use_hash, a file that was touched but not changed is
+    # not copied again. Copies run on a thread pool, since they mostly wait
+    # on the disk. Assets that were removed from static_dir are removed from
+    # output_dir; other files there, such as rendered pages, are left alone.
+    #
+    # With fingerprint, every asset is also written under a name containing
+    # its content hash (see fingerprint_name), for serving with far-future
+    # cache headers; the manifest maps each asset to that name. The plain
+    # name is kept, so templates that link to it still work.
+    use_hash = use_hash or fingerprint
+    if manifest_path is None:
+        manifest_path = os.path.join(output_dir, ASSET_MANIFEST_NAME)
+    previous = load_asset_manifest(manifest_path)
+    assets = {}
+    copies = []
+    report = {"copied": 0, "skipped": 0, "removed": 0, "bytes_copied": 0, "bytes_skipped": 0}
+
+    for asset in find_assets(static_dir):
+        source_path = os.path.join(static_dir, asset)
+        destination_path = os.path.join(output_dir, asset)
+        stat = os.stat(source_path)
+        old = previous.get(asset)
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": None, "fingerprinted": None}
+        changed = (
+            old is None
+            or old["size"] != stat.st_size
+            or not os.path.exists(destination_path)
+            or os.path.getsize(destination_path) != stat.st_size
+        )
+        digest = None
+        if not changed and old["mtime_ns"] != stat.st_mtime_ns:
+            if use_hash and old["hash"] is not None:
+                digest = hash_file(source_path)
+                changed = digest != old["hash"]
+            else:
+                changed = True
+        if use_hash:
+            if digest is None:
+                digest = old["hash"] if not changed and old["hash"] is not None else hash_file(source_path)
+            entry["hash"] = digest
+        if fingerprint:
+            entry["fingerprinted"] = fingerprint_name(asset, digest)
+        assets[asset] = entry
+        if changed:
+            copies.append((source_path, destination_path))
+            report["copied"] += 1
+            report["bytes_copied"] += stat.st_size
+        else:
+            report["skipped"] += 1
+            report["bytes_skipped"] += stat.st_size
+
+    if copies:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for _ in executor.map(lambda job: copy_asset(*job, hardlink=hardlink), copies):
+                pass
+    if fingerprint:
+        for asset, entry in assets.items():
+            link_fingerprinted(os.path.join(output_dir, asset), os.path.join(output_dir, entry["fingerprinted"]))
+
+    for asset, old in previous.items():
+        entry = assets.get(asset)
+        stale = []
+        if entry is None:
+            stale.append(asset)
+            report["removed"] += 1
+        if old["fingerprinted"] is not None and (entry is None or entry["fingerprinted"] != old["fingerprinted"]):
+            stale.append(old["fingerprinted"])
+        for name in stale:
+            path = os.path.join(output_dir, name)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            _remove_empty_dirs(os.path.dirname(path), output_dir)
+
+    save_asset_manifest(manifest_path, assets)
+    return report
+
+
+def asset_url_map(assets):
+    # Root-relative URL of each asset -> URL of its fingerprinted copy, from
+    # the assets of a manifest written with fingerprint.
+    return {
+        "/" + asset.replace(os.sep, "/"): "/" + entry["fingerprinted"].replace(os.sep, "/")
+        for asset, entry in assets.items()
+        if entry["fingerprinted"] is not None
+    }
+
+
+def _rewrite_leaf(leaf, urls, references):
+    props = None
+    for name in URL_PROPS:
+        url = leaf.props.get(name)
+        if url.__class__ is not str or not url.startswith("/"):
+            continue
+        target = urls.get(url)
+        references[url] = target
+        if target is not None:
+            if props is None:
+                props = dict(leaf.props)
+            props[name] = target
+    if props is None:
+        return leaf
+    return type(leaf)(leaf.tag, leaf.value, props)
+
+
+def _rewrite_frame(node):
+    return [node, iter(node.children), [], not isinstance(node.children, (list, tuple))]
+
+
+def rewrite_asset_urls(root, urls):
+    # Points the src and href props of LeafNodes below root at fingerprinted
+    # assets, with one dict lookup per URL. The tree passed in is left as it
+    # is: rewritten leaves and the parents above them are new nodes of the
+    # same types (so frozen leaves stay frozen), everything else is shared.
+    # Returns the new root and every root-relative URL the page uses, mapped
+    # to its fingerprinted URL or None, so a page can be rebuilt when one of
+    # them changes.
+    references = {}
+    if not isinstance(root, ParentNode):
+        if isinstance(root, LeafNode) and root.props:
+            root = _rewrite_leaf(root, urls, references)
+        return root, references
+    # Each frame holds a parent, its remaining children, its new children
+    # and whether they differ from the old ones. Children that are neither
+    # a list nor a tuple can only be read once, so their parent is rebuilt.
+    stack = [_rewrite_frame(root)]
+    while True:
+        frame = stack[-1]
+        for child in frame[1]:
+            if isinstance(child, ParentNode):
+                stack.append(_rewrite_frame(child))
+                break
+            if isinstance(child, LeafNode) and child.props:
+                new_child = _rewrite_leaf(child, urls, references)
+                if new_child is not child:
+                    frame[3] = True
+                    child = new_child
+            frame[2].append(child)
+        else:
+            stack.pop()
+            node, _, children, changed = frame
+            if changed:
+                node = type(node)(node.tag, children, node.props)
+            if not stack:
+                return node, references
+            stack[-1][2].append(node)
+            stack[-1][3] = stack[-1][3] or changed
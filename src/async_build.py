@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from src.build import (
+    entry_changed,
+    find_pages,
+    load_manifest,
+    manifest_entry,
+    open_output,
+    output_path_for,
+    page_context,
+    page_errors,
+    parse_page,
+    remove_deleted,
+    save_manifest,
+    split_front_matter,
+    stat_matches,
+    MANIFEST_NAME,
+)
+import asyncio
+import os
+
+
+def read_source(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def write_output(path, html):
+    with open_output(path) as f:
+        f.write(html)
+
+
+def render_source(data, template):
+    _, markdown = split_front_matter(data.decode("utf-8"))
+    title, root = parse_page(markdown)
+    return template.render(page_context(title, root))
+
+
+async def build_site_async(content_dir, output_dir, template_path=None, incremental=False, manifest_path=None,
+                           readers=32, renderers=1, writers=32, render_executor=None):
+    # Same result and manifest as build_site, for volumes where file access
+    # is slow. Reads and writes run on an I/O thread pool and rendering on
+    # render_executor (a thread per renderer by default; pass a
+    # ProcessPoolExecutor to render on several cores), so waiting on one
+    # page's files overlaps work on others. Each stage has its own limit,
+    # and at most readers + renderers + writers pages are in flight, which
+    # bounds how many sources and rendered pages are held in memory.
+    #
+    # Unlike build_site, each source is read once, for both hashing and
+    # rendering.
+    if manifest_path is None:
+        manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = load_manifest(manifest_path) if incremental else {}
+    loop = asyncio.get_running_loop()
+    read_limit = asyncio.Semaphore(readers)
+    render_limit = asyncio.Semaphore(renderers)
+    write_limit = asyncio.Semaphore(writers)
+    in_flight = asyncio.Semaphore(readers + renderers + writers)
+    templates = {}
+    pages = {}
+
+    io_executor = ThreadPoolExecutor(max_workers=readers + writers)
+    own_executor = render_executor is None
+    if own_executor:
+        render_executor = ThreadPoolExecutor(max_workers=renderers)
+
+    async def build_one(page):
+        source_path = os.path.join(content_dir, page)
+        output_path = output_path_for(page, output_dir)
+        async with in_flight:
+            async with read_limit:
+                stat = await loop.run_in_executor(io_executor, os.stat, source_path)
+                old = previous.get(page)
+                data = None
+                if not stat_matches(old, stat):
+                    data = await loop.run_in_executor(io_executor, read_source, source_path)
+            entry = manifest_entry(old, stat, data, output_path, output_dir, template_path, templates)
+            pages[page] = entry
+            if not entry_changed(old, entry):
+                if await loop.run_in_executor(io_executor, os.path.exists, output_path):
+                    return None
+            entry["assets"] = None
+            if data is None:
+                async with read_limit:
+                    data = await loop.run_in_executor(io_executor, read_source, source_path)
+            with page_errors(source_path):
+                async with render_limit:
+                    html = await loop.run_in_executor(
+                        render_executor, render_source, data, templates[entry["template"]],
+                    )
+                del data
+                async with write_limit:
+                    await loop.run_in_executor(io_executor, write_output, output_path, html)
+            return output_path
+
+    try:
+        page_list = await loop.run_in_executor(io_executor, find_pages, content_dir)
+        results = await asyncio.gather(*(build_one(page) for page in page_list))
+        remove_deleted(previous, pages, output_dir)
+        save_manifest(manifest_path, {page: pages[page] for page in page_list})
+    finally:
+        io_executor.shutdown()
+        if own_executor:
+            render_executor.shutdown()
+    return [path for path in results if path is not None]
+
+
+def build_site_concurrent(content_dir, output_dir, template_path=None, incremental=False, manifest_path=None,
+                          readers=32, renderers=1, writers=32, render_executor=None):
+    return asyncio.run(build_site_async(
+        content_dir, output_dir, template_path, incremental, manifest_path,
+        readers, renderers, writers, render_executor,
+    ))
@@ -0,0 +1,137 @@
+from enum import Enum
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+from src.inline_tokenizer import text_to_textnodes
+from src.util_functions import text_nodes_to_html_nodes
+import re
+
+class BlockType(Enum):
+    PARAGRAPH = "paragraph"
+    HEADING = "heading"
+    CODE = "code"
+    QUOTE = "quote"
+    UNORDERED_LIST = "unordered_list"
+    ORDERED_LIST = "ordered_list"
+
+HEADING_PATTERN = re.compile(r"#{1,6} ")
+CODE_FENCE = "```"
+
+
+def block_to_block_type(block):
+    if HEADING_PATTERN.match(block):
+        return BlockType.HEADING
+    lines = block.split("\n")
+    if len(lines) > 1 and lines[0].startswith(CODE_FENCE) and lines[-1].startswith(CODE_FENCE):
+        return BlockType.CODE
+    if all(line.startswith(">") for line in lines):
+        return BlockType.QUOTE
+    if all(line.startswith("- ") for line in lines):
+        return BlockType.UNORDERED_LIST
+    if all(line.startswith(f"{number}. ") for number, line in enumerate(lines, 1)):
+        return BlockType.ORDERED_LIST
+    return BlockType.PARAGRAPH
+
+
+def iter_blocks(lines):
+    # Blocks are separated by blank lines, except inside ``` fences. Each
+    # block is yielded as soon as its last line has been read, so only one
+    # block is ever held in memory. Trailing whitespace is dropped except
+    # inside fences, where it is part of the code.
+    block_lines = []
+    in_code = False
+    for line in lines:
+        if in_code:
+            line = line.rstrip("\r\n")
+            block_lines.append(line)
+            if line.startswith(CODE_FENCE):
+                in_code = False
+                block = "\n".join(block_lines)
+                block_lines = []
+                yield BlockType.CODE, block
+            continue
+        line = line.rstrip()
+        if not line:
+            if block_lines:
+                block = "\n".join(block_lines)
+                block_lines = []
+                yield block_to_block_type(block), block
+            continue
+        if not block_lines and line.startswith(CODE_FENCE):
+            in_code = True
+        block_lines.append(line)
+    if block_lines:
+        block = "\n".join(block_lines)
+        yield block_to_block_type(block), block
+
+
+def iter_file_blocks(path):
+    with open(path, encoding="utf-8") as f:
+        yield from iter_blocks(f)
+
+
+def text_to_children(text):
+    return list(text_nodes_to_html_nodes(text_to_textnodes(text)))
+
+
+def block_to_html_node(block_type, block, inline=text_to_children):
+    # inline turns the inline markdown of a block into its children, e.g. an
+    # InlineRenderCache's children method.
+    if block_type == BlockType.HEADING:
+        level = block.index(" ")
+        return ParentNode(f"h{level}", inline(block[level + 1:].replace("\n", " ")))
+    if block_type == BlockType.CODE:
+        lines = block.split("\n")
+        code = "\n".join(lines[1:-1]) + "\n"
+        return ParentNode("pre", [LeafNode("code", code)])
+    if block_type == BlockType.QUOTE:
+        text = " ".join(line.lstrip(">").strip() for line in block.split("\n"))
+        return ParentNode("blockquote", inline(text))
+    if block_type == BlockType.UNORDERED_LIST:
+        items = [ParentNode("li", inline(line[2:])) for line in block.split("\n")]
+        return ParentNode("ul", items)
+    if block_type == BlockType.ORDERED_LIST:
+        items = [ParentNode("li", inline(line.split(". ", 1)[1])) for line in block.split("\n")]
+        return ParentNode("ol", items)
+    return ParentNode("p", inline(block.replace("\n", " ")))
+
+
+def iter_html_nodes(blocks, inline=text_to_children):
+    for block_type, block in blocks:
+        yield block_to_html_node(block_type, block, inline)
+
+
+def markdown_to_html_node(markdown, inline=text_to_children):
+    return ParentNode("div", list(iter_html_nodes(iter_blocks(markdown.split("\n")), inline)))
+
+
+class SingleUseChildren:
+    # Children that are produced while they are read. They can only be
+    # iterated once; a second pass, e.g. rendering the node again, raises
+    # instead of silently producing an empty or partial tree.
+    __slots__ = ("iterator",)
+
+    def __init__(self, iterable):
+        self.iterator = iter(iterable)
+
+    def __iter__(self):
+        iterator = self.iterator
+        if iterator is None:
+            raise RuntimeError("streamed children can only be iterated once")
+        self.iterator = None
+        return iterator
+
+
+def markdown_file_to_html_node(path):
+    # The children are produced lazily while the node is serialized, e.g.
+    # with write_to, so the file is parsed one block at a time. The node can
+    # only be serialized or walked once.
+    return ParentNode("div", SingleUseChildren(iter_html_nodes(iter_file_blocks(path))))
+
+
+def extract_title(markdown):
+    # The title is the first h1 block, so "# " lines inside code fences or
+    # paragraphs are not mistaken for it.
+    for block_type, block in iter_blocks(markdown.split("\n")):
+        if block_type == BlockType.HEADING and block.startswith("# "):
+            return block[2:].replace("\n", " ").strip()
+    raise ValueError("no h1 header found")
@@ -0,0 +1,422 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from src.block_parser import markdown_to_html_node, extract_title
+from src.htmlnode import escape_text
+from src.parentnode import ParentNode
+from src.template import CompiledTemplate, compile_template
+from src.assets import rewrite_asset_urls
+from src.doc_cache import DocumentCache
+from src.parallel_render import markdown_to_html_node_parallel, DEFAULT_CHUNK_BYTES
+from src.profiling import PageRecorder, count_nodes, timed_inline
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+
+DEFAULT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{{ Title }}</title>
+</head>
+<body>
+{{ Content }}
+</body>
+</html>
+"""
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 2
+
+
+class PageError(Exception):
+    # A page that could not be built, with the source file it came from.
+    def __init__(self, source_path, message):
+        super().__init__(source_path, message)
+        self.source_path = source_path
+        self.message = message
+
+    def __str__(self):
+        return f"{self.source_path}: {self.message}"
+
+
+@contextmanager
+def page_errors(source_path):
+    # Errors raised while building one page are re-raised as PageError, so
+    # a failing build names the page.
+    try:
+        yield
+    except PageError:
+        raise
+    except Exception as error:
+        raise PageError(source_path, f"{type(error).__name__}: {error}") from error
+
+
+@contextmanager
+def open_output(output_path):
+    # Pages are rendered into a temporary file that replaces the output only
+    # once it is complete, so a page that fails halfway never leaves a
+    # truncated file behind; the previous version stays in place.
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = output_path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def find_pages(content_dir):
+    pages = []
+    for root, _, files in os.walk(content_dir):
+        for name in files:
+            if name.endswith(".md"):
+                pages.append(os.path.relpath(os.path.join(root, name), content_dir))
+    return sorted(pages)
+
+
+def output_path_for(page, output_dir):
+    return os.path.join(output_dir, os.path.splitext(page)[0] + ".html")
+
+
+def split_front_matter(markdown):
+    # An optional block of "key: value" lines between two "---" lines at the
+    # very top of a page, e.g. to pick a template.
+    if not markdown.startswith("---\n"):
+        return {}, markdown
+    end = markdown.find("\n---\n", 3)
+    if end == -1:
+        return {}, markdown
+    meta = {}
+    for line in markdown[4:end].split("\n"):
+        key, separator, value = line.partition(":")
+        if separator:
+            meta[key.strip()] = value.strip()
+    return meta, markdown[end + 5:]
+
+
+def resolve_template(name, template_path):
+    if name is None:
+        return template_path
+    if template_path is None:
+        raise ValueError(f"page selects template {name!r} but no template was given")
+    return os.path.normpath(os.path.join(os.path.dirname(template_path), name))
+
+
+def parse_page(markdown, inline_cache=None, executor=None, chunk_bytes=DEFAULT_CHUNK_BYTES, inline=None):
+    # With an executor, the document is cut into chunks at block boundaries
+    # that are rendered in parallel; the inline cache is not used then.
+    # inline replaces the inline step of every block (see
+    # markdown_to_html_node), e.g. to time it.
+    try:
+        title = extract_title(markdown)
+    except ValueError:
+        title = ""
+    if executor is not None:
+        return title, markdown_to_html_node_parallel(markdown, executor, chunk_bytes)
+    if inline is not None:
+        return title, markdown_to_html_node(markdown, inline)
+    if inline_cache is None:
+        return title, markdown_to_html_node(markdown)
+    return title, markdown_to_html_node(markdown, inline_cache.children)
+
+
+def page_context(title, content):
+    # The title is the text of the page's heading and is escaped like the
+    # heading itself; content is HTML already. A page without any blocks
+    # parses to an empty div, which renders as no content at all.
+    if isinstance(content, ParentNode) and isinstance(content.children, list) and not content.children:
+        content = ""
+    return {"Title": escape_text(title), "Content": content}
+
+
+def fill_template(template, title, content):
+    if isinstance(template, str):
+        template = CompiledTemplate(template)
+    return template.render(page_context(title, content))
+
+
+def render_page(markdown, template):
+    title, root = parse_page(markdown)
+    return fill_template(template, title, root)
+
+
+def build_page(job, templates, cache=None, inline_cache=None, executor=None, chunk_bytes=DEFAULT_CHUNK_BYTES,
+               asset_urls=None, references=None):
+    # With a document cache, a page whose source is unchanged (e.g. when
+    # only its template changed) is not read or parsed at all.
+    #
+    # With asset_urls, links to assets are pointed at their fingerprinted
+    # copies after parsing, so cached trees stay independent of the assets,
+    # and the URLs the page uses are stored in references by source path.
+    source_path, output_path, template_file, source_hash = job
+    with page_errors(source_path):
+        parsed = cache.get(source_hash) if cache is not None else None
+        if parsed is None:
+            with open(source_path, encoding="utf-8") as f:
+                _, markdown = split_front_matter(f.read())
+            parsed = parse_page(markdown, inline_cache, executor, chunk_bytes)
+            if cache is not None:
+                cache.put(source_hash, *parsed)
+        title, root = parsed
+        if asset_urls is not None:
+            root, references[source_path] = rewrite_asset_urls(root, asset_urls)
+        with open_output(output_path) as f:
+            templates[template_file].write_to(f, page_context(title, root))
+    return output_path
+
+
+def profile_page(job, templates, cache=None, inline_cache=None, memory=True, asset_urls=None, references=None):
+    # build_page with every stage timed; returns the output path together
+    # with the page's record. The page is rendered to a string first so
+    # to_html and write are measured separately. Allocation peaks are only
+    # recorded while tracemalloc is tracing; build_chunk turns it on.
+    source_path, output_path, template_file, source_hash = job
+    with page_errors(source_path):
+        recorder = PageRecorder(source_path, memory)
+        start = time.perf_counter()
+        with recorder.stage("read"):
+            parsed = cache.get(source_hash) if cache is not None else None
+            if parsed is None:
+                with open(source_path, encoding="utf-8") as f:
+                    _, markdown = split_front_matter(f.read())
+        if parsed is None:
+            with recorder.stage("parse"):
+                parsed = parse_page(markdown, inline=timed_inline(recorder, inline_cache))
+            if cache is not None:
+                cache.put(source_hash, *parsed)
+        title, root = parsed
+        if asset_urls is not None:
+            root, references[source_path] = rewrite_asset_urls(root, asset_urls)
+        recorder.nodes["html"] = count_nodes(root)
+        with recorder.stage("to_html"):
+            html = templates[template_file].render(page_context(title, root))
+        with recorder.stage("write"):
+            with open_output(output_path) as f:
+                f.write(html)
+        recorder.seconds = time.perf_counter() - start
+    return output_path, recorder.record()
+
+
+def build_chunk(jobs, templates, cache=None, inline_cache=None, profile_memory=None, asset_urls=None):
+    # Builds a run of pages, in a worker process or in the main one. Returns
+    # the results, the inline cache's hit and miss counts for the run and
+    # the asset references of each page.
+    if inline_cache is not None:
+        hits, misses = inline_cache.hits, inline_cache.misses
+    references = {}
+    if profile_memory is None:
+        written = [build_page(job, templates, cache, inline_cache, asset_urls=asset_urls, references=references)
+                   for job in jobs]
+    else:
+        # Tracing slows everything down, so it is only on for the run.
+        tracing = profile_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        try:
+            written = [profile_page(job, templates, cache, inline_cache, profile_memory, asset_urls, references)
+                       for job in jobs]
+        finally:
+            if tracing:
+                tracemalloc.stop()
+    if inline_cache is None:
+        return written, (0, 0), references
+    return written, (inline_cache.hits - hits, inline_cache.misses - misses), references
+
+
+# The inline cache of a worker process, kept for every chunk it builds.
+_worker_inline_cache = None
+
+
+def _init_worker(inline_cache):
+    global _worker_inline_cache
+    _worker_inline_cache = inline_cache
+
+
+def _build_worker_chunk(jobs, **options):
+    return build_chunk(jobs, inline_cache=_worker_inline_cache, **options)
+
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest["pages"]
+
+
+def save_manifest(manifest_path, pages):
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "pages": pages}, f, indent=1, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+
+def use_template(templates, template_file):
+    if template_file not in templates:
+        if template_file is None:
+            templates[template_file] = CompiledTemplate(DEFAULT_TEMPLATE)
+        else:
+            templates[template_file] = compile_template(template_file)
+    return templates[template_file]
+
+
+def stat_matches(old, stat):
+    # An unchanged size and mtime lets the stored hash be reused without
+    # reading the file again.
+    return old is not None and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns
+
+
+def manifest_entry(old, stat, data, output_path, output_dir, template_path, templates):
+    # data is the source's bytes, or None when stat_matches(old, stat).
+    if data is None:
+        source_hash = old["source_hash"]
+        template_name = old["template_name"]
+    else:
+        source_hash = hashlib.sha256(data).hexdigest()
+        template_name = split_front_matter(data.decode("utf-8"))[0].get("template")
+    template_file = resolve_template(template_name, template_path)
+    template = use_template(templates, template_file)
+    return {
+        "output": os.path.relpath(output_path, output_dir),
+        "source_hash": source_hash,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "template_name": template_name,
+        "template": template_file,
+        "template_hash": template.digest,
+        "dependencies": template.dependencies,
+        "assets": None if old is None else old.get("assets"),
+    }
+
+
+def entry_changed(old, entry):
+    return (
+        old is None
+        or old["source_hash"] != entry["source_hash"]
+        or old["template"] != entry["template"]
+        or old["template_hash"] != entry["template_hash"]
+        or old["output"] != entry["output"]
+    )
+
+
+def assets_changed(entry, asset_urls):
+    # entry["assets"] maps each root-relative URL the page used to the
+    # fingerprinted URL it was rendered with, or is None if the page was
+    # rendered without asset_urls.
+    references = entry["assets"]
+    if references is None:
+        return asset_urls is not None
+    asset_urls = asset_urls or {}
+    return any(asset_urls.get(url) != target for url, target in references.items())
+
+
+def remove_deleted(previous, pages, output_dir):
+    for page, old in previous.items():
+        if page not in pages:
+            try:
+                os.remove(os.path.join(output_dir, old["output"]))
+            except FileNotFoundError:
+                pass
+
+
+def build_site(content_dir, output_dir, template_path=None, workers=1, incremental=False, manifest_path=None,
+               cache_dir=None, cache_max_bytes=256 * 1024 * 1024, profile=None, inline_cache=None,
+               split_bytes=None, chunk_bytes=DEFAULT_CHUNK_BYTES, asset_urls=None):
+    # Every page is rendered independently from its own source file, so the
+    # output does not depend on how pages are spread across workers.
+    #
+    # The manifest records, per page, the source's content hash and the hash
+    # of its template together with every partial the template includes. In
+    # incremental mode only pages whose source, template or output changed
+    # are rendered again, and outputs of deleted pages are removed.
+    #
+    # With a BuildProfile, pages go through profile_page instead and their
+    # records are collected into it. An InlineRenderCache is shared by all
+    # pages rendered in the same process; each worker process starts with an
+    # empty copy that it keeps for all its chunks, and their hit and miss
+    # counts are added to the given cache.
+    #
+    # With several workers and split_bytes set, sources of at least that
+    # size are built after the others, one at a time, each cut into chunks
+    # of chunk_bytes that are rendered across the workers. A single huge
+    # page then no longer runs on one core.
+    #
+    # asset_urls (see asset_url_map) rewrites links to fingerprinted assets.
+    # Pages are then also rebuilt when an asset they link to changes, and
+    # neither the inline cache nor split_bytes can be used, as both emit
+    # already rendered HTML.
+    if asset_urls is not None and (inline_cache is not None or split_bytes is not None):
+        raise ValueError("asset_urls cannot be combined with inline_cache or split_bytes")
+    if manifest_path is None:
+        manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = load_manifest(manifest_path) if incremental else {}
+    cache = DocumentCache(cache_dir, cache_max_bytes) if cache_dir is not None else None
+
+    templates = {}
+
+    pages = {}
+    jobs = []
+    rendered = {}
+    for page in find_pages(content_dir):
+        source_path = os.path.join(content_dir, page)
+        output_path = output_path_for(page, output_dir)
+        stat = os.stat(source_path)
+        old = previous.get(page)
+        data = None
+        if not stat_matches(old, stat):
+            with open(source_path, "rb") as f:
+                data = f.read()
+        entry = manifest_entry(old, stat, data, output_path, output_dir, template_path, templates)
+        pages[page] = entry
+        if entry_changed(old, entry) or assets_changed(entry, asset_urls) or not os.path.exists(output_path):
+            jobs.append((source_path, output_path, entry["template"], entry["source_hash"]))
+            entry["assets"] = None
+            rendered[source_path] = entry
+
+    remove_deleted(previous, pages, output_dir)
+
+    profile_memory = None if profile is None else profile.memory
+    large = []
+    if split_bytes is not None and workers > 1 and profile is None:
+        sizes = {job[0]: os.path.getsize(job[0]) for job in jobs}
+        large = [job for job in jobs if sizes[job[0]] >= split_bytes]
+        jobs = [job for job in jobs if sizes[job[0]] < split_bytes]
+    if workers <= 1 or len(jobs) < 2:
+        written, _, references = build_chunk(jobs, templates, cache, inline_cache, profile_memory, asset_urls)
+    else:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        chunks = [jobs[start:start + chunksize] for start in range(0, len(jobs), chunksize)]
+        build = partial(_build_worker_chunk, templates=templates, cache=cache, profile_memory=profile_memory,
+                        asset_urls=asset_urls)
+        written = []
+        references = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(inline_cache,)) as executor:
+            for chunk_written, counts, chunk_references in executor.map(build, chunks):
+                written.extend(chunk_written)
+                references.update(chunk_references)
+                if inline_cache is not None:
+                    inline_cache.add_counts(*counts)
+    for source_path, page_references in references.items():
+        rendered[source_path]["assets"] = page_references
+    if large:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for job in large:
+                written.append(build_page(job, templates, cache, executor=executor, chunk_bytes=chunk_bytes))
+    if profile is not None:
+        for _, record in written:
+            profile.add(record)
+        written = [output_path for output_path, _ in written]
+    save_manifest(manifest_path, pages)
+    if cache is not None:
+        cache.evict()
+    return written
@@ -0,0 +1,145 @@
+from src import block_parser, htmlnode, inline_tokenizer, leafnode, parentnode, textnode, util_functions
+from src.htmlnode import HTMLNode
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+import hashlib
+import marshal
+import os
+import sys
+import zlib
+
+CACHE_FORMAT = 1
+
+# Node trees are stored as a flat pre-order list of records, so nesting
+# depth is not limited by marshal's recursion limit:
+#   (_PARENT, tag, props, child_count)
+#   (_LEAF, tag, value, props)
+#   (_RAW, text)
+_PARENT = 0
+_LEAF = 1
+_RAW = 2
+
+
+def _parser_version():
+    # Any edit to the modules that turn markdown into nodes changes the
+    # version, which invalidates every cached tree. The marshal format is
+    # only stable within one Python version, so that is part of it too.
+    digest = hashlib.sha256(f"{CACHE_FORMAT} {sys.version_info[:2]} {marshal.version}".encode())
+    for module in (textnode, htmlnode, leafnode, parentnode, inline_tokenizer, util_functions, block_parser):
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+PARSER_VERSION = _parser_version()
+
+
+def dump_tree(node):
+    records = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParentNode):
+            children = list(node.children)
+            records.append((_PARENT, node.tag, None if node.props is None else dict(node.props), len(children)))
+            stack.extend(reversed(children))
+        elif isinstance(node, LeafNode):
+            records.append((_LEAF, node.tag, node.value, None if node.props is None else dict(node.props)))
+        elif isinstance(node, HTMLNode):
+            raise TypeError(f"cannot serialize {type(node).__name__}")
+        else:
+            records.append((_RAW, str(node)))
+    return zlib.compress(marshal.dumps(records), 1)
+
+
+def load_tree(data):
+    records = marshal.loads(zlib.decompress(data))
+    root = None
+    # Each stack entry is a ParentNode still waiting for children, with the
+    # number of children it has left to receive.
+    stack = []
+    for record in records:
+        kind = record[0]
+        if kind == _PARENT:
+            node = ParentNode(record[1], [], record[2])
+        elif kind == _LEAF:
+            node = LeafNode(record[1], record[2], record[3])
+        else:
+            node = record[1]
+        if stack:
+            parent = stack[-1]
+            parent[0].children.append(node)
+            parent[1] -= 1
+            if parent[1] == 0:
+                stack.pop()
+        else:
+            root = node
+        if kind == _PARENT and record[3]:
+            stack.append([node, record[3]])
+    return root
+
+
+class DocumentCache:
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, source_hash):
+        return os.path.join(self.directory, f"{PARSER_VERSION}-{source_hash}.bin")
+
+    def get(self, source_hash):
+        path = self.path_for(source_hash)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            title, tree = marshal.loads(data)
+            node = load_tree(tree)
+        except (ValueError, EOFError, TypeError, IndexError, zlib.error):
+            return None
+        try:
+            # The mtime doubles as the last-used time for LRU eviction.
+            os.utime(path)
+        except OSError:
+            pass
+        return title, node
+
+    def put(self, source_hash, title, node):
+        path = self.path_for(source_hash)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(marshal.dumps((title, dump_tree(node))))
+        os.replace(temp_path, path)
+
+    def evict(self):
+        # Drops entries written by other parser versions, then the least
+        # recently used entries until the cache fits in max_bytes.
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".bin"):
+                continue
+            stat = entry.stat()
+            if not entry.name.startswith(f"{PARSER_VERSION}-"):
+                self._remove(entry.path)
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
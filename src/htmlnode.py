@@ -1,6 +1,22 @@
+def escape_text(text):
+    # Most text has nothing to escape; the membership tests are much
+    # cheaper than running the replacements unconditionally.
+    if "&" in text or "<" in text or ">" in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text
+
+
+def escape_attr(value):
+    if value.__class__ is not str:
+        value = str(value)
+    if "&" in value or "<" in value or ">" in value or '"' in value:
+        return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    return value
 
 
 class HTMLNode:
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag = None, value = None, children = None, props = None):
         self.tag = tag
         self.value = value
@@ -8,15 +24,27 @@ class HTMLNode:
         self.props = props
 
     def to_html(self):
+        return "".join(self.iter_html())
+
+    def iter_html(self):
         raise NotImplementedError
-    
+
+    def write_to(self, fp):
+        # Chunks are written as they are produced, so the full document
+        # never has to exist as a single string.
+        fp.writelines(self.iter_html())
+
     def props_to_html(self):
         if not self.props:
             return ""
-        out_str = ""
+        # Nearly every value is a plain string with nothing to escape, so it
+        # is checked inline and only the rest go through escape_attr.
+        html = ""
         for key, value in self.props.items():
-            out_str += f' {key}="{value}"'
-        return out_str
-    
+            if value.__class__ is not str or "&" in value or "<" in value or ">" in value or '"' in value:
+                value = escape_attr(value)
+            html += f' {key}="{value}"'
+        return html
+
     def __repr__(self):
         return f"HTMLNode: {self.tag}, {self.value}, {self.children}, {self.props}"
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from src.block_parser import text_to_children
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class InlineRenderCache:
+    # Bounded LRU map from an inline markdown string (a paragraph, list item,
+    # heading text, ...) to its rendered HTML. A hit skips tokenizing,
+    # conversion and serialization; the HTML is returned as a single raw
+    # string child, which ParentNode writes out unchanged.
+    #
+    # Pickling keeps only the size limit, so a cache sent to a worker
+    # process arrives empty; workers report their counters back separately.
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, inline=text_to_children):
+        html = self.entries.get(text)
+        if html is not None:
+            self.hits += 1
+            self.entries.move_to_end(text)
+            return html
+        self.misses += 1
+        html = "".join(node.to_html() for node in inline(text))
+        self.entries[text] = html
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return html
+
+    def children(self, text, inline=text_to_children):
+        html = self.render(text, inline)
+        return [html] if html else []
+
+    def add_counts(self, hits, misses):
+        self.hits += hits
+        self.misses += misses
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.entries),
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __reduce__(self):
+        return (InlineRenderCache, (self.max_entries,))
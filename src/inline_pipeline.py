@@ -0,0 +1,70 @@
+from src.textnode import SpanTextNode, TextType
+from src.inline_tokenizer import split_text_node
+
+# An inline pass takes a single TEXT TextNode and returns an iterable of
+# TextNodes to replace it. Passes never see non-TEXT nodes.
+
+
+def delimiter_pass(delimiter, text_type):
+    delimiters = ((delimiter, text_type),)
+
+    def split_delimiter(node):
+        return split_text_node(node, delimiters, images=False, links=False)
+
+    return split_delimiter
+
+
+def image_pass(node):
+    return split_text_node(node, (), images=True, links=False)
+
+
+def link_pass(node):
+    return split_text_node(node, (), images=False, links=True)
+
+
+def inline_pass(node):
+    # Bold, italic, code, images and links in one tokenizer scan.
+    return split_text_node(node)
+
+
+def run_inline_passes(nodes, passes):
+    # All passes are fused into one generator: each node is pushed through
+    # the passes depth-first with an explicit stack, so no intermediate
+    # lists are built between passes, and a node that is (or becomes)
+    # non-TEXT is yielded immediately without visiting the remaining passes.
+    pass_count = len(passes)
+    text = TextType.TEXT
+    for node in nodes:
+        if node.text_type != text or not pass_count:
+            yield node
+            continue
+        stack = [(0, iter(passes[0](node)))]
+        while stack:
+            index, pending = stack[-1]
+            for child in pending:
+                next_index = index + 1
+                if child.text_type != text or next_index == pass_count:
+                    yield child
+                else:
+                    stack.append((next_index, iter(passes[next_index](child))))
+                    break
+            else:
+                stack.pop()
+
+
+class InlinePipeline:
+    def __init__(self, passes=None):
+        self.passes = [inline_pass] if passes is None else list(passes)
+
+    def register(self, split, index=None):
+        if index is None:
+            self.passes.append(split)
+        else:
+            self.passes.insert(index, split)
+        return split
+
+    def run(self, nodes):
+        return run_inline_passes(nodes, self.passes)
+
+    def text_to_textnodes(self, text):
+        return list(self.run([SpanTextNode(text, 0, len(text), TextType.TEXT)]))
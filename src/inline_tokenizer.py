@@ -0,0 +1,122 @@
+from src.textnode import TextNode, TextType, SpanTextNode
+import re
+
+DEFAULT_DELIMITERS = (
+    ("**", TextType.BOLD),
+    ("_", TextType.ITALIC),
+    ("`", TextType.CODE),
+)
+
+# Matches the "[text](url)" part of a link or image, anchored at the "[".
+BRACKET_PATTERN = re.compile(r"\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+
+def scan_inline(text, start=0, end=None, delimiters=DEFAULT_DELIMITERS, images=True, links=True):
+    # Yields (start, end, text_type, url) spans over text[start:end] in a
+    # single left-to-right pass. The next occurrence of every delimiter and
+    # of "[" is cached and only searched for again once the scan position
+    # has moved past it, so each character is examined a bounded number of
+    # times: O(len(text) * (len(delimiters) + 1)).
+    if end is None:
+        end = len(text)
+    find = text.find
+    match = BRACKET_PATTERN.match
+    markers = [delimiter for delimiter, _ in delimiters]
+    next_marker = [find(marker, start, end) for marker in markers]
+    next_bracket = find("[", start, end) if images or links else -1
+    pos = start
+
+    while True:
+        best_start = end
+        best = None
+        for index, marker in enumerate(markers):
+            found = next_marker[index]
+            if found != -1 and found < pos:
+                found = next_marker[index] = find(marker, pos, end)
+            if found == -1:
+                continue
+            if found < best_start or (found == best_start and len(marker) > len(markers[best])):
+                best_start = found
+                best = index
+
+        bracket_match = None
+        while next_bracket != -1:
+            if next_bracket < pos:
+                next_bracket = find("[", pos, end)
+                continue
+            bracket = next_bracket
+            is_image = images and bracket > pos and text[bracket - 1] == "!"
+            token_start = bracket - 1 if is_image else bracket
+            if token_start >= best_start:
+                break
+            # A "!" only marks an image when it is not part of the previous
+            # token, e.g. the end of a code span.
+            if not is_image and (not links or (bracket > pos and text[bracket - 1] == "!")):
+                next_bracket = find("[", bracket + 1, end)
+                continue
+            bracket_match = match(text, bracket, end)
+            if bracket_match is None:
+                next_bracket = find("[", bracket + 1, end)
+                continue
+            best_start = token_start
+            break
+
+        if bracket_match is not None:
+            if best_start > pos:
+                yield pos, best_start, TextType.TEXT, None
+            text_type = TextType.IMAGE if best_start != bracket_match.start() else TextType.LINK
+            yield bracket_match.start(1), bracket_match.end(1), text_type, bracket_match.group(2)
+            pos = bracket_match.end()
+            continue
+
+        if best is None:
+            if pos < end:
+                yield pos, end, TextType.TEXT, None
+            return
+
+        marker = markers[best]
+        content_start = best_start + len(marker)
+        closing = find(marker, content_start, end)
+        if closing == -1:
+            raise ValueError("Invalid Markdown syntax: no closing delimiter found")
+        if best_start > pos:
+            yield pos, best_start, TextType.TEXT, None
+        if closing > content_start:
+            yield content_start, closing, delimiters[best][1], None
+        pos = closing + len(marker)
+
+
+def split_text_node(node, delimiters=DEFAULT_DELIMITERS, images=True, links=True):
+    # A SpanTextNode is scanned in place and split into further
+    # SpanTextNodes over the same source, so no substrings are copied.
+    # Empty text yields no spans. As with the chained splitters, a delimiter
+    # pass drops it while the image and link passes keep the node.
+    if isinstance(node, SpanTextNode):
+        source, node_start, node_end = node.source, node.start, node.end
+        spans = list(scan_inline(source, node_start, node_end, delimiters, images, links))
+        if (len(spans) == 1 and spans[0] == (node_start, node_end, TextType.TEXT, None)) or (not spans and not delimiters):
+            return [node]
+        return [SpanTextNode(source, start, end, text_type, url) for start, end, text_type, url in spans]
+    text = node.text
+    spans = list(scan_inline(text, 0, len(text), delimiters, images, links))
+    if (len(spans) == 1 and spans[0] == (0, len(text), TextType.TEXT, None)) or (not spans and not delimiters):
+        return [node]
+    return [TextNode(text[start:end], text_type, url) for start, end, text_type, url in spans]
+
+
+def split_nodes_inline(old_nodes, delimiters=DEFAULT_DELIMITERS, images=True, links=True):
+    new_nodes = []
+
+    for node in old_nodes:
+        if node.text_type != TextType.TEXT:
+            new_nodes.append(node)
+            continue
+        new_nodes.extend(split_text_node(node, delimiters, images, links))
+
+    return new_nodes
+
+
+def text_to_textnodes(text):
+    # The nodes are spans over text; each substring is only copied out when
+    # it is converted to HTML.
+    return split_nodes_inline([SpanTextNode(text, 0, len(text), TextType.TEXT)])
@@ -1,15 +1,58 @@
-from src.htmlnode import HTMLNode
+from src.htmlnode import HTMLNode, escape_text
+from types import MappingProxyType
+
+VOID_ELEMENTS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"))
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
         super().__init__(tag, value, None, props)
 
     def to_html(self):
+        if self.tag in VOID_ELEMENTS:
+            return f"<{self.tag}{self.props_to_html()}>"
         if not self.value:
             raise ValueError("invalid HTML: no value")
         if not self.tag:
-            return self.value
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            return escape_text(self.value)
+        return f"<{self.tag}{self.props_to_html()}>{escape_text(self.value)}</{self.tag}>"
+
+    def iter_html(self):
+        yield self.to_html()
     
     def __repr__(self):
-        return f"LeafNode: {self.tag}, {self.value}, {self.props}"
\ No newline at end of file
+        return f"LeafNode: {self.tag}, {self.value}, {self.props}"
+
+class FrozenLeafNode(LeafNode):
+    __slots__ = ("_hash", "__weakref__")
+
+    def __init__(self, tag, value, props=None):
+        if props is not None:
+            props = MappingProxyType(dict(props))
+        object.__setattr__(self, "tag", tag)
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "children", None)
+        object.__setattr__(self, "props", props)
+        object.__setattr__(self, "_hash", hash((tag, value, frozenset(props.items()) if props is not None else None)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, LeafNode):
+            return False
+        return self.tag == other.tag and self.value == other.value and self.props == other.props
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (FrozenLeafNode, (self.tag, self.value, None if self.props is None else dict(self.props)))
+
+    def __repr__(self):
+        props = None if self.props is None else dict(self.props)
+        return f"LeafNode: {self.tag}, {self.value}, {props}"
@@ -1,7 +1,126 @@
-from textnode import TextNode, TextType
+from concurrent.futures import ProcessPoolExecutor
+from src.assets import asset_url_map, load_asset_manifest, sync_assets, ASSET_MANIFEST_NAME
+from src.async_build import build_site_concurrent
+from src.build import build_site
+from src.inline_cache import InlineRenderCache
+from src.profiling import BuildProfile
+from src.stream_build import stream_build_site
+from src.serve import SiteWatcher, start_server, watch
+import argparse
+import os
+import time
 
-def main():
-    text_node = TextNode("This is some anchor text", TextType.LINK, "https://www.boot.dev")
-    print(text_node)
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="main.sh", description="Static site generator")
+    commands = parser.add_subparsers(dest="command", required=True)
 
-main()
\ No newline at end of file
+    build = commands.add_parser("build", help="convert every markdown page to HTML")
+    build.add_argument("--content", default="content", help="directory of markdown pages")
+    build.add_argument("--output", default="public", help="directory to write HTML into")
+    build.add_argument("--template", default=None, help="HTML template with {{ Title }} and {{ Content }}")
+    build.add_argument("--static", default="static", help="directory of assets mirrored into the output")
+    build.add_argument("--asset-hash", action="store_true", help="compare asset contents when only the mtime changed")
+    build.add_argument("--link-assets", action="store_true", help="hardlink assets instead of copying them")
+    build.add_argument("--fingerprint", action="store_true",
+                       help="also write assets under content-hashed names and link pages to those")
+    build.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    build.add_argument("--incremental", action="store_true", help="only rebuild pages whose source or template changed")
+    build.add_argument("--cache", default=None, help="directory for the parsed-document cache")
+    build.add_argument("--cache-size", type=int, default=256, help="parsed-document cache size limit in MiB")
+    build.add_argument("--split-size", type=float, default=None, metavar="MIB",
+                       help="render pages of at least MIB megabytes in chunks across the workers")
+    build.add_argument("--chunk-size", type=int, default=1024, help="chunk size in KiB for --split-size")
+    build.add_argument("--inline-cache", type=int, default=0, metavar="ENTRIES",
+                       help="cache the rendered HTML of up to ENTRIES repeated inline fragments")
+    build.add_argument("--async", dest="async_io", action="store_true",
+                       help="overlap file reads, rendering and writes, for slow or network volumes")
+    build.add_argument("--readers", type=int, default=32, help="concurrent file reads with --async")
+    build.add_argument("--writers", type=int, default=32, help="concurrent file writes with --async")
+    build.add_argument("--stream", action="store_true",
+                       help="full build with memory bounded by --memory-limit, regardless of page count")
+    build.add_argument("--memory-limit", type=int, default=64, help="memory for pages in flight with --stream, in MiB")
+    build.add_argument("--queue-size", type=int, default=8, help="pages waiting between stages with --stream")
+    build.add_argument("--profile", default=None, metavar="REPORT", help="time each build stage and write a JSON report")
+    build.add_argument("--profile-top", type=int, default=10, help="number of slowest pages in the profile report")
+    build.add_argument("--profile-no-memory", action="store_true", help="skip tracemalloc peak measurements")
+
+    serve = commands.add_parser("serve", help="build, then rebuild on change and serve the output on localhost")
+    serve.add_argument("--content", default="content", help="directory of markdown pages")
+    serve.add_argument("--output", default="public", help="directory to write HTML into")
+    serve.add_argument("--template", default=None, help="HTML template with {{ Title }} and {{ Content }}")
+    serve.add_argument("--port", type=int, default=8888, help="port to serve on")
+    serve.add_argument("--interval", type=float, default=0.02, help="seconds between change polls")
+
+    args = parser.parse_args(argv)
+    asset_urls = None
+    if args.command == "build":
+        if args.fingerprint and (args.async_io or args.stream or args.inline_cache or args.split_size):
+            parser.error("--fingerprint cannot be combined with --async, --stream, --inline-cache or --split-size")
+        if os.path.isdir(args.static):
+            report = sync_assets(
+                args.static, args.output, use_hash=args.asset_hash, hardlink=args.link_assets,
+                fingerprint=args.fingerprint,
+            )
+            print(
+                f"assets: {report['copied']} copied ({report['bytes_copied']} bytes), "
+                f"{report['skipped']} unchanged ({report['bytes_skipped']} bytes), {report['removed']} removed"
+            )
+            if args.fingerprint:
+                asset_urls = asset_url_map(load_asset_manifest(os.path.join(args.output, ASSET_MANIFEST_NAME)))
+        elif args.fingerprint:
+            asset_urls = {}
+    if args.command == "build" and args.stream:
+        if args.async_io or args.incremental or args.cache or args.inline_cache or args.profile:
+            parser.error("--stream cannot be combined with --async, --incremental, --cache, --inline-cache or --profile")
+        start = time.perf_counter()
+        count = stream_build_site(
+            args.content, args.output, args.template, args.queue_size, args.memory_limit * 1024 * 1024,
+        )
+        print(f"built {count} pages in {time.perf_counter() - start:.2f}s")
+    elif args.command == "build" and args.async_io:
+        if args.cache or args.inline_cache or args.profile:
+            parser.error("--async cannot be combined with --cache, --inline-cache or --profile")
+        start = time.perf_counter()
+        executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+        try:
+            pages = build_site_concurrent(
+                args.content, args.output, args.template, args.incremental,
+                readers=args.readers, renderers=args.workers, writers=args.writers, render_executor=executor,
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        print(f"built {len(pages)} pages in {time.perf_counter() - start:.2f}s")
+    elif args.command == "build":
+        profile = None
+        if args.profile is not None:
+            profile = BuildProfile(args.profile_top, memory=not args.profile_no_memory)
+        inline_cache = InlineRenderCache(args.inline_cache) if args.inline_cache > 0 else None
+        start = time.perf_counter()
+        pages = build_site(
+            args.content, args.output, args.template, args.workers, args.incremental,
+            cache_dir=args.cache, cache_max_bytes=args.cache_size * 1024 * 1024, profile=profile,
+            inline_cache=inline_cache,
+            split_bytes=None if args.split_size is None else int(args.split_size * 1024 * 1024),
+            chunk_bytes=args.chunk_size * 1024, asset_urls=asset_urls,
+        )
+        print(f"built {len(pages)} pages in {time.perf_counter() - start:.2f}s")
+        if inline_cache is not None:
+            print(f"inline cache: {inline_cache.hits} hits, {inline_cache.misses} misses")
+        if profile is not None:
+            profile.write(args.profile)
+            print(f"profile written to {args.profile}")
+    elif args.command == "serve":
+        watcher = SiteWatcher(args.content, args.output, args.template)
+        start = time.perf_counter()
+        pages = watcher.full_build()
+        print(f"built {len(pages)} pages in {time.perf_counter() - start:.2f}s")
+        server = start_server(args.output, port=args.port)
+        print(f"serving {args.output} at http://127.0.0.1:{server.server_address[1]}/")
+        try:
+            watch(watcher, args.interval)
+        except KeyboardInterrupt:
+            server.shutdown()
+
+if __name__ == "__main__":
+    main()
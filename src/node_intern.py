@@ -0,0 +1,38 @@
+from src.textnode import TextNode, FrozenTextNode
+from src.leafnode import LeafNode, FrozenLeafNode
+import weakref
+
+# Weak-value tables: an interned node lives only as long as something
+# outside the table still references it.
+_text_nodes = weakref.WeakValueDictionary()
+_leaf_nodes = weakref.WeakValueDictionary()
+
+
+def intern_text_node(text, text_type, url=None):
+    key = (text, text_type, url)
+    node = _text_nodes.get(key)
+    if node is None:
+        node = FrozenTextNode(text, text_type, url)
+        _text_nodes[key] = node
+    return node
+
+
+def intern_leaf_node(tag, value, props=None):
+    key = (tag, value, frozenset(props.items()) if props is not None else None)
+    node = _leaf_nodes.get(key)
+    if node is None:
+        node = FrozenLeafNode(tag, value, props)
+        _leaf_nodes[key] = node
+    return node
+
+
+def intern_node(node):
+    if isinstance(node, TextNode):
+        return intern_text_node(node.text, node.text_type, node.url)
+    if isinstance(node, LeafNode):
+        return intern_leaf_node(node.tag, node.value, node.props)
+    raise TypeError(f"cannot intern {type(node).__name__}")
+
+
+def interned_count():
+    return len(_text_nodes) + len(_leaf_nodes)
@@ -0,0 +1,53 @@
+from collections import deque
+from src.block_parser import block_to_html_node, iter_blocks
+from src.parentnode import ParentNode
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+DEFAULT_MAX_PENDING = 8
+
+
+def iter_block_chunks(blocks, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    # Groups whole blocks into runs of about chunk_bytes of markdown. Blocks
+    # come from iter_blocks, so a chunk never ends inside a code fence.
+    chunk = []
+    size = 0
+    for block in blocks:
+        chunk.append(block)
+        size += len(block[1])
+        if size >= chunk_bytes:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def render_block_chunk(chunk):
+    return "".join([block_to_html_node(block_type, block).to_html() for block_type, block in chunk])
+
+
+def iter_rendered_chunks(blocks, executor, chunk_bytes=DEFAULT_CHUNK_BYTES, max_pending=DEFAULT_MAX_PENDING):
+    # Submits chunks as they are cut and yields their HTML in document
+    # order. At most max_pending chunks are queued or rendering at a time,
+    # which bounds memory on very large files.
+    pending = deque()
+    try:
+        for chunk in iter_block_chunks(blocks, chunk_bytes):
+            pending.append(executor.submit(render_block_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def markdown_to_html_node_parallel(markdown, executor, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                                   max_pending=DEFAULT_MAX_PENDING):
+    # Same HTML as markdown_to_html_node(markdown).to_html(), with inline
+    # parsing, conversion and serialization of each chunk done on executor
+    # (usually a ProcessPoolExecutor). The chunks' HTML becomes the raw
+    # string children of the div.
+    blocks = iter_blocks(markdown.split("\n"))
+    return ParentNode("div", list(iter_rendered_chunks(blocks, executor, chunk_bytes, max_pending)))
@@ -1,17 +1,42 @@
 from src.htmlnode import HTMLNode
+from src.leafnode import LeafNode
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props)
 
-    def to_html(self):
+    def open_tag(self):
         if not self.tag:
             raise ValueError("invalid HTML: no tag")
         if not self.children:
             raise ValueError("invalid HTML: no children")
-        
-        children_html = ''.join(
-            child.to_html() if isinstance(child, HTMLNode) else str(child)
-            for child in self.children
-        )
-        return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
\ No newline at end of file
+        return f"<{self.tag}{self.props_to_html()}>"
+
+    def iter_html(self):
+        # Nested ParentNodes are walked with an explicit stack instead of
+        # recursion, so tree depth is limited by memory rather than by the
+        # interpreter's recursion limit. Subclasses that override iter_html
+        # are still asked to render themselves.
+        walk = ParentNode.iter_html
+        leaf = LeafNode.iter_html
+        yield self.open_tag()
+        stack = [(self.tag, iter(self.children))]
+        while stack:
+            tag, children = stack[-1]
+            for child in children:
+                if isinstance(child, ParentNode) and type(child).iter_html is walk:
+                    yield child.open_tag()
+                    stack.append((child.tag, iter(child.children)))
+                    break
+                if isinstance(child, HTMLNode):
+                    if type(child).iter_html is leaf:
+                        yield child.to_html()
+                    else:
+                        yield from child.iter_html()
+                else:
+                    yield str(child)
+            else:
+                stack.pop()
+                yield f"</{tag}>"
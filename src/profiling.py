@@ -0,0 +1,122 @@
+from contextlib import contextmanager
+from src.inline_tokenizer import text_to_textnodes
+from src.util_functions import text_nodes_to_html_nodes
+import heapq
+import json
+import time
+import tracemalloc
+
+STAGES = ("read", "parse", "inline", "convert", "to_html", "write")
+
+
+class PageRecorder:
+    # Collects stage timings, allocation peaks and node counts for one page.
+    # Stages nest (inline and convert run inside parse). Entering a stage
+    # resets the tracemalloc peak, so every open stage carries the highest
+    # peak its inner stages saw.
+    def __init__(self, page, memory=True):
+        self.page = page
+        self.memory = memory
+        self.stages = {}
+        self.nodes = {"text": 0, "html": 0}
+        self.seconds = 0.0
+        self.frames = []
+
+    @contextmanager
+    def stage(self, name):
+        base = 0
+        if self.memory:
+            base, peak = tracemalloc.get_traced_memory()
+            if self.frames:
+                self.frames[-1][1] = max(self.frames[-1][1], peak)
+            tracemalloc.reset_peak()
+        frame = [base, 0]
+        self.frames.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.frames.pop()
+            peak = 0
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                if self.frames:
+                    self.frames[-1][1] = max(self.frames[-1][1], peak)
+            stats = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "peak_bytes": 0})
+            stats["seconds"] += seconds
+            stats["calls"] += 1
+            stats["peak_bytes"] = max(stats["peak_bytes"], peak - frame[0])
+
+    def record(self):
+        return {"page": self.page, "seconds": self.seconds, "nodes": self.nodes, "stages": self.stages}
+
+
+def timed_inline(recorder, inline_cache=None):
+    # An inline function for markdown_to_html_node that records the
+    # inline and conversion steps of each block. With an inline cache, only
+    # cache misses reach these steps.
+    def inline(text):
+        with recorder.stage("inline"):
+            nodes = text_to_textnodes(text)
+        recorder.nodes["text"] += len(nodes)
+        with recorder.stage("convert"):
+            return list(text_nodes_to_html_nodes(nodes))
+
+    if inline_cache is None:
+        return inline
+    return lambda text: inline_cache.children(text, inline)
+
+
+def count_nodes(root):
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        children = getattr(node, "children", None)
+        if children:
+            stack.extend(children)
+    return count
+
+
+class BuildProfile:
+    # Aggregates page records from every worker. Only the `top` slowest
+    # pages are kept in full.
+    def __init__(self, top=10, memory=True):
+        self.top = top
+        self.memory = memory
+        self.pages = 0
+        self.seconds = 0.0
+        self.nodes = {"text": 0, "html": 0}
+        self.stages = {}
+        self.slowest = []
+
+    def add(self, record):
+        self.pages += 1
+        self.seconds += record["seconds"]
+        for kind, count in record["nodes"].items():
+            self.nodes[kind] += count
+        for name, stats in record["stages"].items():
+            total = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "peak_bytes": 0})
+            total["seconds"] += stats["seconds"]
+            total["calls"] += stats["calls"]
+            total["peak_bytes"] = max(total["peak_bytes"], stats["peak_bytes"])
+        entry = (record["seconds"], self.pages, record)
+        if len(self.slowest) < self.top:
+            heapq.heappush(self.slowest, entry)
+        elif self.top:
+            heapq.heappushpop(self.slowest, entry)
+
+    def report(self):
+        return {
+            "pages": self.pages,
+            "seconds": self.seconds,
+            "nodes": dict(self.nodes),
+            "stages": {name: self.stages[name] for name in STAGES if name in self.stages},
+            "slowest": [record for _, _, record in sorted(self.slowest, key=lambda entry: (-entry[0], entry[1]))],
+        }
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=1)
@@ -0,0 +1,142 @@
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from src.build import (
+    build_site,
+    build_page,
+    find_pages,
+    load_manifest,
+    output_path_for,
+    resolve_template,
+    PageError,
+    split_front_matter,
+    DEFAULT_TEMPLATE,
+    MANIFEST_NAME,
+)
+from src.template import CompiledTemplate, compile_template
+import os
+import threading
+import time
+
+
+class SiteWatcher:
+    # Keeps one process warm between edits. Changes are found by polling
+    # mtimes and sizes; an edited page is re-rendered on its own, while a
+    # template or partial change falls back to an incremental build, which
+    # re-renders exactly the pages using it.
+    def __init__(self, content_dir, output_dir, template_path=None):
+        self.content_dir = content_dir
+        self.output_dir = output_dir
+        self.template_path = template_path
+        self.templates = {}
+        self.dependencies = set()
+        self.pages = {}
+        self.template_files = {}
+        self.errors = []
+
+    def scan_pages(self):
+        pages = {}
+        for page in find_pages(self.content_dir):
+            try:
+                stat = os.stat(os.path.join(self.content_dir, page))
+            except FileNotFoundError:
+                continue
+            pages[page] = (stat.st_mtime_ns, stat.st_size)
+        return pages
+
+    def scan_templates(self):
+        # Only the templates and partials pages actually use are watched.
+        files = {}
+        for path in self.dependencies:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                files[path] = None
+                continue
+            files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def full_build(self):
+        # Snapshots are taken first so a failing build is not retried on
+        # every poll, only after the next edit.
+        self.templates = {}
+        self.pages = self.scan_pages()
+        self.template_files = self.scan_templates()
+        written = build_site(self.content_dir, self.output_dir, self.template_path, incremental=True)
+        manifest = load_manifest(os.path.join(self.output_dir, MANIFEST_NAME))
+        self.dependencies = {path for entry in manifest.values() for path in entry["dependencies"]}
+        if self.template_path is not None:
+            self.dependencies.add(os.path.normpath(self.template_path))
+        self.template_files = self.scan_templates()
+        return written
+
+    def template(self, template_file):
+        if template_file not in self.templates:
+            if template_file is None:
+                self.templates[template_file] = CompiledTemplate(DEFAULT_TEMPLATE)
+            else:
+                self.templates[template_file] = compile_template(template_file)
+                self.dependencies.update(self.templates[template_file].dependencies)
+        return self.templates[template_file]
+
+    def render(self, page):
+        source_path = os.path.join(self.content_dir, page)
+        with open(source_path, encoding="utf-8") as f:
+            meta, _ = split_front_matter(f.read())
+        template_file = resolve_template(meta.get("template"), self.template_path)
+        templates = {template_file: self.template(template_file)}
+        return build_page((source_path, output_path_for(page, self.output_dir), template_file, None), templates)
+
+    def poll(self):
+        if self.scan_templates() != self.template_files:
+            return self.full_build()
+        pages = self.scan_pages()
+        written = []
+        for page, state in pages.items():
+            if self.pages.get(page) == state:
+                continue
+            # A page that fails to render is reported once and retried only
+            # after its next edit.
+            try:
+                written.append(self.render(page))
+            except PageError as error:
+                self.errors.append(f"{page}: {error.message}")
+            except (OSError, ValueError) as error:
+                self.errors.append(f"{page}: {error}")
+        for page in self.pages:
+            if page not in pages:
+                try:
+                    os.remove(output_path_for(page, self.output_dir))
+                except FileNotFoundError:
+                    pass
+        self.pages = pages
+        self.template_files = self.scan_templates()
+        return written
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(output_dir, host="127.0.0.1", port=8888):
+    os.makedirs(output_dir, exist_ok=True)
+    server = ThreadingHTTPServer((host, port), partial(QuietHandler, directory=output_dir))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def watch(watcher, interval=0.02, report=print, stop=None):
+    while stop is None or not stop.is_set():
+        start = time.perf_counter()
+        try:
+            written = watcher.poll()
+        except (OSError, ValueError) as error:
+            report(f"build failed: {error}")
+            written = []
+        for error in watcher.errors:
+            report(f"build failed: {error}")
+        watcher.errors.clear()
+        if written:
+            report(f"rebuilt {len(written)} pages in {(time.perf_counter() - start) * 1000:.1f} ms")
+        time.sleep(interval)
@@ -0,0 +1,184 @@
+from src.build import (
+    open_output,
+    output_path_for,
+    page_context,
+    page_errors,
+    parse_page,
+    split_front_matter,
+    resolve_template,
+    use_template,
+)
+import os
+import queue
+import threading
+
+# A parsed node tree takes roughly six to seven bytes per byte of markdown;
+# the estimate errs on the high side.
+TREE_BYTES_PER_SOURCE_BYTE = 8
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+DEFAULT_QUEUE_SIZE = 8
+
+_DONE = object()
+
+
+class MemoryBudget:
+    # Bytes reserved by pages between being read and being written. A
+    # reservation blocks until enough has been released, except that a
+    # single page larger than the whole limit may go ahead on its own.
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self.peak = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, size, stop):
+        with self.condition:
+            while self.used and self.used + size > self.limit:
+                if stop.is_set():
+                    return False
+                self.condition.wait(0.1)
+            self.used += size
+            self.peak = max(self.peak, self.used)
+            return True
+
+    def release(self, size):
+        with self.condition:
+            self.used -= size
+            self.condition.notify_all()
+
+
+class StreamingBuild:
+    # Builds pages as a three-stage pipeline: a reader thread, a parser
+    # thread and the caller's thread writing HTML out. The stages are joined
+    # by bounded queues, so a slow stage holds the earlier ones back, and
+    # the memory budget caps what all pages in flight may take together.
+    # Each page's tree is dropped as soon as it has been written, so memory
+    # use does not grow with the number of pages.
+    #
+    # pages is any iterable of page names, read(page) returns its markdown
+    # and open_output(page) returns a writable text file for it.
+    def __init__(self, read, open_output, template_path=None, queue_size=DEFAULT_QUEUE_SIZE,
+                 memory_limit=DEFAULT_MEMORY_LIMIT):
+        self.read = read
+        self.open_output = open_output
+        self.template_path = template_path
+        self.queue_size = queue_size
+        self.budget = MemoryBudget(memory_limit)
+        self.templates = {}
+
+    def run(self, pages):
+        parsed = queue.Queue(self.queue_size)
+        sources = queue.Queue(self.queue_size)
+        stop = threading.Event()
+        errors = []
+        threads = [
+            threading.Thread(target=self._stage, args=(self._read_pages, pages, sources, stop, errors)),
+            threading.Thread(target=self._stage, args=(self._parse_pages, sources, parsed, stop, errors)),
+        ]
+        for thread in threads:
+            thread.start()
+        count = 0
+        try:
+            while True:
+                item = parsed.get()
+                if item is _DONE:
+                    break
+                page, template_file, title, root, size = item
+                del item
+                with page_errors(page), self.open_output(page) as f:
+                    self.templates[template_file].write_to(f, page_context(title, root))
+                del root
+                self.budget.release(size)
+                count += 1
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+        return count
+
+    def _stage(self, work, source, sink, stop, errors):
+        # A failing stage stops the others and passes its error on; the
+        # sentinel always goes through so the next stage finishes.
+        try:
+            work(source, sink, stop)
+        except Exception as error:
+            errors.append(error)
+            stop.set()
+        _put(sink, _DONE, stop, force=True)
+
+    def _read_pages(self, pages, sources, stop):
+        for page in pages:
+            if stop.is_set():
+                return
+            markdown = self.read(page)
+            size = len(markdown) * TREE_BYTES_PER_SOURCE_BYTE
+            if not self.budget.acquire(size, stop):
+                return
+            if not _put(sources, (page, markdown, size), stop):
+                return
+
+    def _parse_pages(self, sources, parsed, stop):
+        while True:
+            item = sources.get()
+            if item is _DONE or stop.is_set():
+                return
+            page, markdown, size = item
+            with page_errors(page):
+                meta, markdown = split_front_matter(markdown)
+                template_file = resolve_template(meta.get("template"), self.template_path)
+                use_template(self.templates, template_file)
+                title, root = parse_page(markdown)
+            del markdown, item
+            if not _put(parsed, (page, template_file, title, root, size), stop):
+                return
+            del root
+
+
+def _put(target, item, stop, force=False):
+    # Blocks while the queue is full, giving up once the build is stopped.
+    # force is used for end-of-stream markers, which must not be lost.
+    while True:
+        try:
+            target.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            if stop.is_set():
+                if not force:
+                    return False
+                try:
+                    target.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+def iter_pages(content_dir):
+    # Like find_pages, but lazily: directories are walked in sorted order
+    # and pages are yielded as they are found, so the full page list is
+    # never built.
+    for root, dirs, files in os.walk(content_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".md"):
+                yield os.path.relpath(os.path.join(root, name), content_dir)
+
+
+def stream_build_site(content_dir, output_dir, template_path=None, queue_size=DEFAULT_QUEUE_SIZE,
+                      memory_limit=DEFAULT_MEMORY_LIMIT):
+    # Full, non-incremental build with memory bounded by memory_limit
+    # regardless of the number of pages. No manifest is written, so the
+    # next --incremental build renders every page again. Returns the number
+    # of pages written.
+    def read(page):
+        with open(os.path.join(content_dir, page), encoding="utf-8") as f:
+            return f.read()
+
+    def open_page_output(page):
+        return open_output(output_path_for(page, output_dir))
+
+    build = StreamingBuild(read, open_page_output, template_path, queue_size, memory_limit)
+    return build.run(iter_pages(content_dir))
@@ -0,0 +1,86 @@
+from src.htmlnode import HTMLNode
+from src.leafnode import FrozenLeafNode, LeafNode
+from src.parentnode import ParentNode
+
+# Shared layout subtrees (navigation, sidebars, footers) are rendered into
+# every page. A CachedParentNode keeps its rendered HTML, together with a
+# snapshot of the tag, value, props and children of every node below it.
+# Before the HTML is reused the snapshot is compared with the tree, which
+# is much cheaper than rendering it again; any difference re-renders the
+# tree. Each cached tree is checked on its own, so changing one never
+# invalidates another, and the nodes themselves are left as they are.
+
+# Only node types whose output depends on nothing but these fields.
+_SUPPORTED = frozenset((LeafNode, FrozenLeafNode, ParentNode))
+
+
+def _snapshot(root):
+    # One (node, tag, value, props, children) entry per node, with copies
+    # of the props and children so that changes made in place show up.
+    # Frozen leaves cannot change and are only checked through their
+    # parent's children.
+    entries = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if type(node) is FrozenLeafNode:
+            continue
+        children = node.children
+        if children is not None:
+            if not isinstance(children, (list, tuple)):
+                node.children = list(children)
+                children = list(node.children)
+            elif isinstance(children, list):
+                children = list(children)
+            for child in children:
+                if isinstance(child, HTMLNode):
+                    if type(child) not in _SUPPORTED and type(child) is not CachedParentNode:
+                        raise TypeError(f"cannot cache {type(child).__name__}")
+                    stack.append(child)
+        props = node.props
+        entries.append((node, node.tag, node.value, None if props is None else dict(props), children))
+    return entries
+
+
+def _unchanged(snapshot):
+    for node, tag, value, props, children in snapshot:
+        if node.tag != tag or node.value != value or node.props != props or node.children != children:
+            return False
+    return True
+
+
+class CachedParentNode(ParentNode):
+    __slots__ = ("_html", "_snapshot")
+
+    def __init__(self, tag, children, props=None):
+        super().__init__(tag, children, props)
+        self._html = None
+        self._snapshot = None
+
+    def to_html(self):
+        if self._html is not None and _unchanged(self._snapshot):
+            return self._html
+        self._html = None
+        self._snapshot = _snapshot(self)
+        self._html = "".join(ParentNode.iter_html(self))
+        return self._html
+
+    def iter_html(self):
+        yield self.to_html()
+
+    def __reduce__(self):
+        return (CachedParentNode, (self.tag, self.children, self.props))
+
+
+def cache_html(node):
+    # Returns a CachedParentNode with the tag, children and props of a
+    # ParentNode. The output is the same as the node's; changes to the
+    # cached node, its props or anything below it are picked up on the next
+    # render. Children that are generators are read into a list first.
+    if type(node) is CachedParentNode:
+        return node
+    if type(node) is not ParentNode:
+        raise TypeError(f"cannot cache {type(node).__name__}")
+    cached = CachedParentNode(node.tag, node.children, node.props)
+    _snapshot(cached)
+    return cached
@@ -0,0 +1,93 @@
+from src.htmlnode import HTMLNode
+import hashlib
+import os
+import re
+
+PARTIAL_PATTERN = re.compile(r"\{\{>\s*([^\s}]+)\s*\}\}")
+SLOT_PATTERN = re.compile(r"(\{\{\s*(\w+)\s*\}\})")
+
+
+def load_template(path):
+    # Returns the template text with every {{> partial.html }} inlined, and
+    # the list of files it was assembled from (the template first). Partials
+    # are resolved relative to the file that includes them.
+    dependencies = []
+
+    def expand(file_path, including):
+        file_path = os.path.normpath(file_path)
+        if file_path in including:
+            raise ValueError(f"partial includes itself: {file_path}")
+        if file_path not in dependencies:
+            dependencies.append(file_path)
+        with open(file_path, encoding="utf-8") as f:
+            text = f.read()
+        directory = os.path.dirname(file_path)
+        return PARTIAL_PATTERN.sub(
+            lambda match: expand(os.path.join(directory, match.group(1)), including | {file_path}),
+            text,
+        )
+
+    return expand(path, frozenset()), dependencies
+
+
+def hash_files(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class CompiledTemplate:
+    # A template split once into literal text and named slots, e.g.
+    # {{ Title }} and {{ Content }}. Slots missing from the context are left
+    # as they were written.
+    def __init__(self, text, dependencies=(), digest=None):
+        parts = SLOT_PATTERN.split(text)
+        self.literals = tuple(parts[0::3])
+        self.placeholders = tuple(parts[1::3])
+        self.slots = tuple(parts[2::3])
+        self.dependencies = list(dependencies)
+        if digest is None:
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        self.digest = digest
+
+    def iter_render(self, context):
+        literals = self.literals
+        for index, slot in enumerate(self.slots):
+            yield literals[index]
+            value = context.get(slot)
+            if value is None:
+                yield self.placeholders[index]
+            elif isinstance(value, HTMLNode):
+                yield from value.iter_html()
+            else:
+                yield value
+        yield literals[-1]
+
+    def render(self, context):
+        return "".join(self.iter_render(context))
+
+    def write_to(self, fp, context):
+        # HTMLNode slot values are streamed into fp chunk by chunk.
+        fp.writelines(self.iter_render(context))
+
+
+_compiled = {}
+
+
+def compile_template(path):
+    # Compiled templates are cached per path and reused for as long as the
+    # content hash of the template and all its partials is unchanged.
+    path = os.path.normpath(path)
+    cached = _compiled.get(path)
+    if cached is not None:
+        try:
+            if hash_files(cached.dependencies) == cached.digest:
+                return cached
+        except FileNotFoundError:
+            pass
+    text, dependencies = load_template(path)
+    template = CompiledTemplate(text, dependencies, hash_files(dependencies))
+    _compiled[path] = template
+    return template
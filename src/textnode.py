@@ -9,6 +9,8 @@ class TextType(Enum):
     TEXT = "text"
 
 class TextNode:
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type:TextType, url=None):
         self.text = text
         self.text_type = text_type
@@ -19,4 +21,47 @@ class TextNode:
         return self.text == other.text and self.text_type == other.text_type and self.url == other.url
     def __repr__(self):
         return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
-    
+
+
+class FrozenTextNode(TextNode):
+    __slots__ = ("_hash", "__weakref__")
+
+    def __init__(self, text, text_type:TextType, url=None):
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "text_type", text_type)
+        object.__setattr__(self, "url", url)
+        object.__setattr__(self, "_hash", hash((text, text_type, url)))
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    def __hash__(self):
+        return self._hash
+    def __reduce__(self):
+        return (FrozenTextNode, (self.text, self.text_type, self.url))
+
+
+class SpanTextNode(TextNode):
+    # Refers to source[start:end] instead of holding its own copy of the
+    # text; the substring is only built when .text is read. The source is
+    # kept in TextNode's text slot, so a span only adds its two offsets.
+    __slots__ = ("start", "end")
+
+    source = TextNode.text
+
+    def __init__(self, source, start, end, text_type:TextType, url=None):
+        self.source = source
+        self.start = start
+        self.end = end
+        self.text_type = text_type
+        self.url = url
+    @property
+    def text(self):
+        return self.source[self.start:self.end]
+    @text.setter
+    def text(self, value):
+        self.source = value
+        self.start = 0
+        self.end = len(value)
+    def __reduce__(self):
+        return (SpanTextNode, (self.source, self.start, self.end, self.text_type, self.url))
@@ -1,100 +1,66 @@
-from src.textnode import TextType, TextNode
+from src.textnode import TextType
 from src.leafnode import LeafNode
-import re
+from src.inline_tokenizer import scan_inline, split_nodes_inline
 
-def text_node_to_html_node(text_node):
-    mapping = {
-        TextType.TEXT:  lambda tn: LeafNode(None, tn.text),
-        TextType.BOLD:  lambda tn: LeafNode("b", tn.text),
-        TextType.ITALIC: lambda tn: LeafNode("i", tn.text),
-        TextType.CODE:  lambda tn: LeafNode("code", tn.text),
-        TextType.LINK:  lambda tn: LeafNode("a", tn.text, {"href": tn.url}),
-        TextType.IMAGE: lambda tn: LeafNode("img", "", {"src": tn.url, "alt": tn.text}),
-    }
+TEXT_NODE_CONVERTERS = {
+    TextType.TEXT:  lambda tn: LeafNode(None, tn.text),
+    TextType.BOLD:  lambda tn: LeafNode("b", tn.text),
+    TextType.ITALIC: lambda tn: LeafNode("i", tn.text),
+    TextType.CODE:  lambda tn: LeafNode("code", tn.text),
+    TextType.LINK:  lambda tn: LeafNode("a", tn.text, {"href": tn.url}),
+    TextType.IMAGE: lambda tn: LeafNode("img", "", {"src": tn.url, "alt": tn.text}),
+}
 
+def text_node_to_html_node(text_node):
     try:
-        return mapping[text_node.text_type](text_node)
+        converter = TEXT_NODE_CONVERTERS[text_node.text_type]
     except KeyError:
         raise Exception(f"Invalid TextType: {text_node.text_type}")
-    
-def split_nodes_delimiter(old_nodes, delimiter, text_type):
-    new_nodes = []
+    return converter(text_node)
+
+def text_nodes_to_html_nodes(text_nodes):
+    # Lazy, so it can be handed straight to a ParentNode as its children.
+    converters = TEXT_NODE_CONVERTERS
+    for text_node in text_nodes:
+        try:
+            converter = converters[text_node.text_type]
+        except KeyError:
+            raise Exception(f"Invalid TextType: {text_node.text_type}")
+        yield converter(text_node)
 
-    for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            new_nodes.append(node)
+def split_nodes_delimiter(old_nodes, delimiter, text_type):
+    return split_nodes_inline(old_nodes, ((delimiter, text_type),), images=False, links=False)
+
+def _bracket_spans(text, images, links):
+    # Same scan as the splitters; the inner text span is widened to the
+    # whole "![alt](url)" or "[anchor](url)".
+    spans = []
+    for start, end, text_type, url in scan_inline(text, delimiters=(), images=images, links=links):
+        if text_type == TextType.TEXT:
             continue
-        split_text = node.text.split(delimiter)
-        if len(split_text) % 2 == 0:
-            raise ValueError("Invalid Markdown syntax: no closing delimiter found")
-        for index, text_part in enumerate(split_text):
-            if text_part == "":
-                continue
-            type =  text_type if index % 2 != 0 else TextType.TEXT
-            new_nodes.append(TextNode(text_part, type))
-    
-    return new_nodes
+        opening = 2 if text_type == TextType.IMAGE else 1
+        spans.append((start - opening, end + len(url) + 3, text[start:end], url))
+    return spans
+
+def extract_markdown_image_spans(text):
+    if "![" not in text:
+        return []
+    return _bracket_spans(text, images=True, links=False)
+
+def extract_markdown_link_spans(text):
+    if "[" not in text:
+        return []
+    return _bracket_spans(text, images=False, links=True)
 
 def extract_markdown_images(text):
-    return re.findall(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    return [(alt, url) for _, _, alt, url in extract_markdown_image_spans(text)]
 
 
 def extract_markdown_links(text):
-    return re.findall(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    return [(anchor, url) for _, _, anchor, url in extract_markdown_link_spans(text)]
 
 def split_nodes_image(old_nodes):
-    new_nodes = []
-
-    for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            new_nodes.append(node)
-            continue
-
-        node_text = node.text
-        images = extract_markdown_images(node_text)
-
-        if len(images) == 0:
-            new_nodes.append(node)
-            continue
-
-        for alt, url in images:
-            markdown = f"![{alt}]({url})"
-            sections = node_text.split(markdown, 1)
-            if sections[0] != "":
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
-            new_nodes.append(TextNode(alt, TextType.IMAGE, url))
-            node_text = sections[1]
-        if node_text != "":
-            new_nodes.append(TextNode(node_text, TextType.TEXT))
-
-    return new_nodes
+    return split_nodes_inline(old_nodes, (), images=True, links=False)
 
 def split_nodes_link(old_nodes):
-    new_nodes = []
-
-    for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            new_nodes.append(node)
-            continue
-
-        text = node.text
-        links = extract_markdown_links(text)
-
-        if len(links) == 0:
-            new_nodes.append(node)
-            continue
-
-        for anchor, url in links:
-            markdown = f"[{anchor}]({url})"
-            before, after = text.split(markdown, 1)
-
-            if before != "":
-                new_nodes.append(TextNode(before, TextType.TEXT))
-
-            new_nodes.append(TextNode(anchor, TextType.LINK, url))
-            text = after
-
-        if text != "":
-            new_nodes.append(TextNode(text, TextType.TEXT))
-
-    return new_nodes
\ No newline at end of file
+    return split_nodes_inline(old_nodes, (), images=False, links=True)
@@ -0,0 +1,213 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src import assets
+from src.assets import (
+    asset_url_map,
+    copy_asset,
+    fingerprint_name,
+    find_assets,
+    hash_file,
+    load_asset_manifest,
+    rewrite_asset_urls,
+    sync_assets,
+    ASSET_MANIFEST_NAME,
+)
+from src.leafnode import FrozenLeafNode, LeafNode
+from src.parentnode import ParentNode
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class TestAssets(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.static = os.path.join(self.tmp.name, "static")
+        self.output = os.path.join(self.tmp.name, "public")
+        write(os.path.join(self.static, "css", "site.css"), b"body {}")
+        write(os.path.join(self.static, "images", "logo.png"), b"\x89PNG" + bytes(range(256)) * 100)
+        write(os.path.join(self.static, "robots.txt"), b"")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_assets(self):
+        self.assertListEqual(
+            find_assets(self.static),
+            [os.path.join("css", "site.css"), os.path.join("images", "logo.png"), "robots.txt"],
+        )
+
+    def test_first_sync_copies_everything(self):
+        report = sync_assets(self.static, self.output)
+        self.assertEqual(report["copied"], 3)
+        self.assertEqual(report["bytes_copied"], 7 + 4 + 25600)
+        for asset in find_assets(self.static):
+            self.assertEqual(read(os.path.join(self.output, asset)), read(os.path.join(self.static, asset)))
+        self.assertTrue(os.path.exists(os.path.join(self.output, ASSET_MANIFEST_NAME)))
+
+    def test_unchanged_assets_are_skipped(self):
+        sync_assets(self.static, self.output)
+        report = sync_assets(self.static, self.output)
+        self.assertEqual((report["copied"], report["skipped"], report["bytes_copied"]), (0, 3, 0))
+        self.assertEqual(report["bytes_skipped"], 7 + 4 + 25600)
+
+    def test_changed_and_missing_assets_are_copied(self):
+        sync_assets(self.static, self.output)
+        write(os.path.join(self.static, "css", "site.css"), b"body { color: red }")
+        os.remove(os.path.join(self.output, "robots.txt"))
+        report = sync_assets(self.static, self.output)
+        self.assertEqual((report["copied"], report["skipped"]), (2, 1))
+        self.assertEqual(read(os.path.join(self.output, "css", "site.css")), b"body { color: red }")
+        self.assertTrue(os.path.exists(os.path.join(self.output, "robots.txt")))
+
+    def test_touched_file_with_hash(self):
+        sync_assets(self.static, self.output, use_hash=True)
+        path = os.path.join(self.static, "css", "site.css")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(sync_assets(self.static, self.output, use_hash=True)["copied"], 0)
+        write(path, b"body {!}"[:7])
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        self.assertEqual(sync_assets(self.static, self.output, use_hash=True)["copied"], 1)
+
+    def test_touched_file_without_hash(self):
+        sync_assets(self.static, self.output)
+        path = os.path.join(self.static, "css", "site.css")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(sync_assets(self.static, self.output)["copied"], 1)
+
+    def test_orphans_are_removed(self):
+        write(os.path.join(self.output, "index.html"), b"<html>")
+        sync_assets(self.static, self.output)
+        os.remove(os.path.join(self.static, "images", "logo.png"))
+        report = sync_assets(self.static, self.output)
+        self.assertEqual(report["removed"], 1)
+        self.assertFalse(os.path.exists(os.path.join(self.output, "images")))
+        self.assertTrue(os.path.exists(os.path.join(self.output, "index.html")))
+
+    def test_hardlink(self):
+        sync_assets(self.static, self.output, hardlink=True)
+        source = os.stat(os.path.join(self.static, "css", "site.css"))
+        copy = os.stat(os.path.join(self.output, "css", "site.css"))
+        self.assertEqual((source.st_dev, source.st_ino), (copy.st_dev, copy.st_ino))
+
+    def test_copy_fallbacks(self):
+        source = os.path.join(self.static, "images", "logo.png")
+        for methods in ((), (assets._sendfile,), (assets._copy_file_range,)):
+            destination = os.path.join(self.tmp.name, "copies", f"{len(methods)}.png")
+            with mock.patch.object(assets, "_KERNEL_COPIES", methods):
+                copy_asset(source, destination)
+            self.assertEqual(read(destination), read(source))
+
+    def test_failing_kernel_copy_falls_back(self):
+        def broken(source, destination, size):
+            destination.write(b"partial")
+            raise OSError("not supported")
+
+        source = os.path.join(self.static, "images", "logo.png")
+        destination = os.path.join(self.tmp.name, "copies", "logo.png")
+        with mock.patch.object(assets, "_KERNEL_COPIES", (broken,)):
+            copy_asset(source, destination)
+        self.assertEqual(read(destination), read(source))
+        self.assertFalse(os.path.exists(destination + assets.TEMP_SUFFIX))
+
+
+class TestFingerprints(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.static = os.path.join(self.tmp.name, "static")
+        self.output = os.path.join(self.tmp.name, "public")
+        self.logo = os.path.join(self.static, "images", "logo.png")
+        write(self.logo, b"logo v1")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def urls(self):
+        return asset_url_map(load_asset_manifest(os.path.join(self.output, ASSET_MANIFEST_NAME)))
+
+    def test_fingerprint_name(self):
+        self.assertEqual(fingerprint_name(os.path.join("images", "logo.png"), "3f9a1c0000"), os.path.join("images", "logo.3f9a1c.png"))
+        self.assertEqual(fingerprint_name("LICENSE", "abcdef12"), "LICENSE.abcdef")
+
+    def test_fingerprinted_copy(self):
+        sync_assets(self.static, self.output, fingerprint=True)
+        name = fingerprint_name(os.path.join("images", "logo.png"), hash_file(self.logo))
+        self.assertEqual(read(os.path.join(self.output, name)), b"logo v1")
+        self.assertEqual(read(os.path.join(self.output, "images", "logo.png")), b"logo v1")
+        self.assertDictEqual(self.urls(), {"/images/logo.png": "/" + name.replace(os.sep, "/")})
+
+    def test_changed_asset_gets_new_name(self):
+        sync_assets(self.static, self.output, fingerprint=True)
+        old = self.urls()["/images/logo.png"]
+        write(self.logo, b"logo v2")
+        sync_assets(self.static, self.output, fingerprint=True)
+        new = self.urls()["/images/logo.png"]
+        self.assertNotEqual(old, new)
+        self.assertFalse(os.path.exists(self.output + old))
+        self.assertEqual(read(self.output + new), b"logo v2")
+
+    def test_removed_asset_and_fingerprint_off(self):
+        sync_assets(self.static, self.output, fingerprint=True)
+        fingerprinted = self.output + self.urls()["/images/logo.png"]
+        sync_assets(self.static, self.output)
+        self.assertFalse(os.path.exists(fingerprinted))
+        self.assertDictEqual(self.urls(), {})
+        sync_assets(self.static, self.output, fingerprint=True)
+        os.remove(self.logo)
+        self.assertEqual(sync_assets(self.static, self.output, fingerprint=True)["removed"], 1)
+        self.assertListEqual(os.listdir(self.output), [ASSET_MANIFEST_NAME])
+
+    def test_rewrite_asset_urls(self):
+        shared = {"href": "/images/logo.png"}
+        unchanged = ParentNode("p", [LeafNode("a", "home", {"href": "/index.html"})])
+        root = ParentNode("div", [
+            ParentNode("p", [
+                LeafNode("img", "", {"src": "/images/logo.png", "alt": "logo"}),
+                LeafNode("a", "logo", shared),
+                LeafNode("a", "out", {"href": "https://example.com/images/logo.png"}),
+            ]),
+            unchanged,
+            FrozenLeafNode("a", "frozen", {"href": "/images/logo.png"}),
+            "raw",
+        ])
+        before = root.to_html()
+        rewritten, references = rewrite_asset_urls(root, {"/images/logo.png": "/images/logo.abc123.png"})
+        self.assertDictEqual(references, {"/images/logo.png": "/images/logo.abc123.png", "/index.html": None})
+        self.assertEqual(rewritten.to_html(), (
+            '<div><p><img src="/images/logo.abc123.png" alt="logo">'
+            '<a href="/images/logo.abc123.png">logo</a><a href="https://example.com/images/logo.png">out</a></p>'
+            '<p><a href="/index.html">home</a></p><a href="/images/logo.abc123.png">frozen</a>raw</div>'
+        ))
+        self.assertEqual(root.to_html(), before)
+        self.assertEqual(shared["href"], "/images/logo.png")
+        self.assertIs(rewritten.children[1], unchanged)
+        self.assertIs(type(rewritten.children[2]), FrozenLeafNode)
+
+    def test_rewrite_keeps_unchanged_tree(self):
+        root = ParentNode("div", [ParentNode("p", [LeafNode("a", "x", {"href": "/page.html"})])])
+        rewritten, references = rewrite_asset_urls(root, {"/images/logo.png": "/images/logo.abc123.png"})
+        self.assertIs(rewritten, root)
+        self.assertDictEqual(references, {"/page.html": None})
+
+    def test_rewrite_tuple_and_single_use_children(self):
+        urls = {"/a.png": "/a.123456.png"}
+        root = ParentNode("div", (ParentNode("p", iter([LeafNode("img", "", {"src": "/a.png"})])), "raw"))
+        rewritten, _ = rewrite_asset_urls(root, urls)
+        self.assertEqual(rewritten.to_html(), '<div><p><img src="/a.123456.png"></p>raw</div>')
+        self.assertIsInstance(root.children, tuple)
+
+
+if __name__ == "__main__":
+    unittest.main()
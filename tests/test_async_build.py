@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from src.async_build import build_site_concurrent
+from src.build import build_site, MANIFEST_NAME
+from tests.helpers import read, write
+
+
+def tree(directory):
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            files[os.path.relpath(path, directory)] = read(path)
+    return files
+
+
+class TestAsyncBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.templates = os.path.join(self.tmp.name, "templates")
+        write(os.path.join(self.templates, "base.html"), "<title>{{ Title }}</title>{{ Content }}")
+        write(os.path.join(self.templates, "post.html"), "<article>{{ Content }}</article>")
+        for index in range(20):
+            write(os.path.join(self.content, f"dir{index % 3}", f"page{index}.md"), f"# Page {index}\n\ntext **{index}**\n")
+        write(os.path.join(self.content, "post.md"), "---\ntemplate: post.html\n---\n# Post\n\nbody\n")
+        self.template = os.path.join(self.templates, "base.html")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_same_output_and_manifest_as_build_site(self):
+        sequential = os.path.join(self.tmp.name, "sequential")
+        concurrent = os.path.join(self.tmp.name, "concurrent")
+        expected = build_site(self.content, sequential, self.template)
+        written = build_site_concurrent(self.content, concurrent, self.template, readers=4, renderers=2, writers=4)
+        self.assertListEqual(
+            [os.path.relpath(path, concurrent) for path in written],
+            [os.path.relpath(path, sequential) for path in expected],
+        )
+        self.assertDictEqual(tree(concurrent), tree(sequential))
+        self.assertIn(MANIFEST_NAME, tree(concurrent))
+
+    def test_process_pool_renderer(self):
+        sequential = os.path.join(self.tmp.name, "sequential")
+        concurrent = os.path.join(self.tmp.name, "concurrent")
+        build_site(self.content, sequential, self.template)
+        with ProcessPoolExecutor(2) as executor:
+            build_site_concurrent(self.content, concurrent, self.template, renderers=2, render_executor=executor)
+        self.assertDictEqual(tree(concurrent), tree(sequential))
+
+    def test_incremental(self):
+        output = os.path.join(self.tmp.name, "public")
+        self.assertEqual(len(build_site_concurrent(self.content, output, self.template, incremental=True)), 21)
+        self.assertListEqual(build_site_concurrent(self.content, output, self.template, incremental=True), [])
+
+        write(os.path.join(self.content, "dir1", "page1.md"), "# Changed\n")
+        os.remove(os.path.join(self.content, "dir2", "page2.md"))
+        os.remove(os.path.join(output, "dir0", "page0.html"))
+        written = build_site_concurrent(self.content, output, self.template, incremental=True)
+        self.assertListEqual(
+            [os.path.relpath(path, output) for path in written],
+            [os.path.join("dir0", "page0.html"), os.path.join("dir1", "page1.html")],
+        )
+        self.assertIn("<h1>Changed</h1>", read(os.path.join(output, "dir1", "page1.html")))
+        self.assertFalse(os.path.exists(os.path.join(output, "dir2", "page2.html")))
+        self.assertListEqual(build_site(self.content, output, self.template, incremental=True), [])
+
+    def test_missing_template_raises(self):
+        with self.assertRaises(ValueError):
+            build_site_concurrent(self.content, os.path.join(self.tmp.name, "public"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import io
+import os
+import tempfile
+import unittest
+from src.block_parser import (
+    BlockType,
+    block_to_block_type,
+    iter_blocks,
+    iter_file_blocks,
+    markdown_to_html_node,
+    markdown_file_to_html_node,
+    extract_title,
+)
+
+
+class TestBlockToBlockType(unittest.TestCase):
+    def test_block_types(self):
+        cases = [
+            ("# Heading", BlockType.HEADING),
+            ("###### Small", BlockType.HEADING),
+            ("####### Too deep", BlockType.PARAGRAPH),
+            ("```\ncode\n```", BlockType.CODE),
+            ("> quote\n> more", BlockType.QUOTE),
+            ("- a\n- b", BlockType.UNORDERED_LIST),
+            ("1. a\n2. b", BlockType.ORDERED_LIST),
+            ("1. a\n3. b", BlockType.PARAGRAPH),
+            ("just text", BlockType.PARAGRAPH),
+        ]
+        for block, expected in cases:
+            with self.subTest(block=block):
+                self.assertEqual(block_to_block_type(block), expected)
+
+
+class TestIterBlocks(unittest.TestCase):
+    def test_splits_on_blank_lines(self):
+        lines = ["# Title", "", "para line one", "line two  ", "", "", "- a", "- b"]
+        self.assertListEqual(
+            list(iter_blocks(lines)),
+            [
+                (BlockType.HEADING, "# Title"),
+                (BlockType.PARAGRAPH, "para line one\nline two"),
+                (BlockType.UNORDERED_LIST, "- a\n- b"),
+            ],
+        )
+
+    def test_code_fence_keeps_blank_lines(self):
+        lines = ["```", "a", "", "b", "```", "after"]
+        self.assertListEqual(
+            list(iter_blocks(lines)),
+            [(BlockType.CODE, "```\na\n\nb\n```"), (BlockType.PARAGRAPH, "after")],
+        )
+
+    def test_code_keeps_trailing_whitespace(self):
+        lines = ["```  \n", "a  \n", "  \n", "b\t\r\n", "```\n", "after  \n"]
+        self.assertListEqual(
+            list(iter_blocks(lines)),
+            [(BlockType.CODE, "```\na  \n  \nb\t\n```"), (BlockType.PARAGRAPH, "after")],
+        )
+
+    def test_blocks_are_yielded_as_they_finish(self):
+        def lines():
+            yield "first block\n"
+            yield "\n"
+            raise AssertionError("read too far")
+
+        blocks = iter_blocks(lines())
+        self.assertEqual(next(blocks), (BlockType.PARAGRAPH, "first block"))
+
+    def test_file_blocks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# Title\n\nSome text\n")
+            self.assertListEqual(
+                list(iter_file_blocks(path)),
+                [(BlockType.HEADING, "# Title"), (BlockType.PARAGRAPH, "Some text")],
+            )
+
+
+class TestMarkdownToHTMLNode(unittest.TestCase):
+    def test_paragraphs(self):
+        md = "This is **bolded** paragraph\ntext in a p\ntag here\n\nThis is another paragraph with _italic_ text and `code` here\n"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p>"
+            "<p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>",
+        )
+
+    def test_codeblock(self):
+        md = "```\nThis is text that _should_ remain\nthe **same** even with inline stuff\n```\n"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>",
+        )
+
+    def test_headings_quotes_and_lists(self):
+        md = "## Sub [link](/a)\n\n> quoted\n> text\n\n- one\n- **two**\n\n1. first\n2. ![pic](p.png)\n"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            '<div><h2>Sub <a href="/a">link</a></h2>'
+            "<blockquote>quoted text</blockquote>"
+            "<ul><li>one</li><li><b>two</b></li></ul>"
+            '<ol><li>first</li><li><img src="p.png" alt="pic"></li></ol></div>',
+        )
+
+    def test_file_is_streamed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.md")
+            md = "# Title\n\n- a\n- b\n\n```\nx < y\n```\n"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(md)
+            out = io.StringIO()
+            node = markdown_file_to_html_node(path)
+            node.write_to(out)
+            self.assertEqual(out.getvalue(), markdown_to_html_node(md).to_html())
+            with self.assertRaises(RuntimeError):
+                node.to_html()
+
+
+class TestExtractTitle(unittest.TestCase):
+    def test_title(self):
+        self.assertEqual(extract_title("intro\n\n# Hello  \n\n## Sub"), "Hello")
+
+    def test_title_skips_code_fences(self):
+        self.assertEqual(extract_title("```\n# not a title\n```\n\n# Real"), "Real")
+        self.assertEqual(extract_title("```\n\n# not a title\n```\n\n# Real"), "Real")
+
+    def test_missing_title(self):
+        with self.assertRaises(ValueError):
+            extract_title("## Only sub")
+
+
+if __name__ == "__main__":
+    unittest.main()
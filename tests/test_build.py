@@ -0,0 +1,237 @@
+import os
+import tempfile
+import unittest
+from src.build import build_site, find_pages, render_page, output_path_for, split_front_matter, MANIFEST_NAME, PageError
+from tests.helpers import read, write
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.output = os.path.join(self.tmp.name, "public")
+        write(os.path.join(self.content, "index.md"), "# Home\n\nWelcome to **the** site\n")
+        write(os.path.join(self.content, "blog", "post.md"), "# Post\n\n- one\n- two\n")
+        write(os.path.join(self.content, "blog", "notes.txt"), "not markdown")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_pages_is_sorted(self):
+        self.assertListEqual(find_pages(self.content), [os.path.join("blog", "post.md"), "index.md"])
+
+    def test_output_path_for(self):
+        self.assertEqual(output_path_for(os.path.join("blog", "post.md"), "out"), os.path.join("out", "blog", "post.html"))
+
+    def test_render_page(self):
+        html = render_page("# Hi\n\ntext", "<title>{{ Title }}</title>{{ Content }}")
+        self.assertEqual(html, "<title>Hi</title><div><h1>Hi</h1><p>text</p></div>")
+
+    def test_title_is_escaped(self):
+        html = render_page("# a <b> & c", "<title>{{ Title }}</title>{{ Content }}")
+        self.assertEqual(html, "<title>a &lt;b&gt; &amp; c</title><div><h1>a &lt;b&gt; &amp; c</h1></div>")
+        write(os.path.join(self.content, "index.md"), "# <script>x</script>\n")
+        build_site(self.content, self.output)
+        self.assertIn("<title>&lt;script&gt;x&lt;/script&gt;</title>", read(os.path.join(self.output, "index.html")))
+
+    def test_build_site(self):
+        template = os.path.join(self.tmp.name, "template.html")
+        write(template, "<title>{{ Title }}</title><main>{{ Content }}</main>")
+        written = build_site(self.content, self.output, template)
+        self.assertListEqual(
+            written,
+            [os.path.join(self.output, "blog", "post.html"), os.path.join(self.output, "index.html")],
+        )
+        self.assertEqual(
+            read(os.path.join(self.output, "index.html")),
+            "<title>Home</title><main><div><h1>Home</h1><p>Welcome to <b>the</b> site</p></div></main>",
+        )
+
+    def test_empty_pages(self):
+        self.assertEqual(render_page("", "<title>{{ Title }}</title>{{ Content }}"), "<title></title>")
+        write(os.path.join(self.content, "empty.md"), "")
+        write(os.path.join(self.content, "meta.md"), "---\ntemplate: other.html\n---\n")
+        template = os.path.join(self.tmp.name, "template.html")
+        write(template, "<main>{{ Content }}</main>")
+        write(os.path.join(self.tmp.name, "other.html"), "<aside>{{ Content }}</aside>")
+        build_site(self.content, self.output, template)
+        self.assertEqual(read(os.path.join(self.output, "empty.html")), "<main></main>")
+        self.assertEqual(read(os.path.join(self.output, "meta.html")), "<aside></aside>")
+
+    def test_errors_name_the_page(self):
+        bad = os.path.join(self.content, "blog", "bad.md")
+        write(bad, "# Bad\n\nset my_var to 1\n")
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                with self.assertRaises(PageError) as raised:
+                    build_site(self.content, self.output, workers=workers)
+                self.assertEqual(raised.exception.source_path, bad)
+                self.assertIn(bad, str(raised.exception))
+                self.assertIn("no closing delimiter", str(raised.exception))
+
+    def test_failed_render_keeps_previous_output(self):
+        page = os.path.join(self.content, "index.md")
+        output = os.path.join(self.output, "index.html")
+        build_site(self.content, self.output)
+        before = read(output)
+        # An empty quote only fails once the page is being written.
+        write(page, "# Home\n\n>\n")
+        with self.assertRaises(PageError):
+            build_site(self.content, self.output)
+        self.assertEqual(read(output), before)
+        self.assertListEqual(sorted(os.listdir(self.output)), [MANIFEST_NAME, "blog", "index.html"])
+
+    def test_output_independent_of_workers(self):
+        for i in range(20):
+            write(os.path.join(self.content, "many", f"page{i}.md"), f"# Page {i}\n\nBody _{i}_\n")
+        serial = os.path.join(self.tmp.name, "serial")
+        parallel = os.path.join(self.tmp.name, "parallel")
+        build_site(self.content, serial, workers=1)
+        build_site(self.content, parallel, workers=2)
+        for page in find_pages(self.content):
+            self.assertEqual(read(output_path_for(page, serial)), read(output_path_for(page, parallel)))
+
+
+class TestSplitFrontMatter(unittest.TestCase):
+    def test_front_matter(self):
+        meta, body = split_front_matter("---\ntemplate: docs.html\ntitle: x\n---\n# Body\n")
+        self.assertDictEqual(meta, {"template": "docs.html", "title": "x"})
+        self.assertEqual(body, "# Body\n")
+
+    def test_no_front_matter(self):
+        self.assertEqual(split_front_matter("# Body\n---\n"), ({}, "# Body\n---\n"))
+
+    def test_unterminated_front_matter(self):
+        self.assertEqual(split_front_matter("---\ntemplate: x\n"), ({}, "---\ntemplate: x\n"))
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.content = os.path.join(root, "content")
+        self.output = os.path.join(root, "public")
+        self.templates = os.path.join(root, "templates")
+        self.template = os.path.join(self.templates, "default.html")
+        write(self.template, "{{> nav.html }}<main>{{ Content }}</main>")
+        write(os.path.join(self.templates, "docs.html"), "{{> nav.html }}<article>{{ Content }}</article>{{> footer.html }}")
+        write(os.path.join(self.templates, "nav.html"), "<nav>site</nav>")
+        write(os.path.join(self.templates, "footer.html"), "<footer>f</footer>")
+        write(os.path.join(self.content, "index.md"), "# Home\n")
+        write(os.path.join(self.content, "about.md"), "# About\n")
+        write(os.path.join(self.content, "docs.md"), "---\ntemplate: docs.html\n---\n# Docs\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self):
+        return build_site(self.content, self.output, self.template, incremental=True)
+
+    def built_pages(self, written):
+        return sorted(os.path.relpath(path, self.output) for path in written)
+
+    def test_first_build_renders_everything(self):
+        self.assertListEqual(self.built_pages(self.build()), ["about.html", "docs.html", "index.html"])
+        self.assertEqual(
+            read(os.path.join(self.output, "docs.html")),
+            "<nav>site</nav><article><div><h1>Docs</h1></div></article><footer>f</footer>",
+        )
+        self.assertTrue(os.path.exists(os.path.join(self.output, MANIFEST_NAME)))
+
+    def test_unchanged_build_renders_nothing(self):
+        self.build()
+        self.assertListEqual(self.build(), [])
+
+    def test_changed_page_only(self):
+        self.build()
+        write(os.path.join(self.content, "about.md"), "# About us\n")
+        self.assertListEqual(self.built_pages(self.build()), ["about.html"])
+        self.assertIn("About us", read(os.path.join(self.output, "about.html")))
+
+    def test_added_and_removed_pages(self):
+        self.build()
+        os.remove(os.path.join(self.content, "about.md"))
+        write(os.path.join(self.content, "new.md"), "# New\n")
+        self.assertListEqual(self.built_pages(self.build()), ["new.html"])
+        self.assertFalse(os.path.exists(os.path.join(self.output, "about.html")))
+
+    def test_template_change_rebuilds_its_pages(self):
+        self.build()
+        write(self.template, "<main>{{ Content }}</main>")
+        self.assertListEqual(self.built_pages(self.build()), ["about.html", "index.html"])
+
+    def test_partial_change_rebuilds_pages_using_it(self):
+        self.build()
+        write(os.path.join(self.templates, "footer.html"), "<footer>new</footer>")
+        self.assertListEqual(self.built_pages(self.build()), ["docs.html"])
+        write(os.path.join(self.templates, "nav.html"), "<nav>new</nav>")
+        self.assertListEqual(self.built_pages(self.build()), ["about.html", "docs.html", "index.html"])
+
+    def test_switching_template_rebuilds_page(self):
+        self.build()
+        write(os.path.join(self.content, "index.md"), "---\ntemplate: docs.html\n---\n# Home\n")
+        self.assertListEqual(self.built_pages(self.build()), ["index.html"])
+        self.assertIn("<article>", read(os.path.join(self.output, "index.html")))
+
+    def test_deleted_output_is_rebuilt(self):
+        self.build()
+        os.remove(os.path.join(self.output, "index.html"))
+        self.assertListEqual(self.built_pages(self.build()), ["index.html"])
+
+    def test_full_build_ignores_manifest(self):
+        self.build()
+        written = build_site(self.content, self.output, self.template)
+        self.assertEqual(len(written), 3)
+
+
+class TestBuildWithAssets(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.output = os.path.join(self.tmp.name, "public")
+        write(os.path.join(self.content, "logo.md"), "# Logo\n\n![logo](/images/logo.png)\n")
+        write(os.path.join(self.content, "plain.md"), "# Plain\n\n[home](/index.html)\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, asset_urls, **options):
+        written = build_site(self.content, self.output, incremental=True, asset_urls=asset_urls, **options)
+        return sorted(os.path.basename(path) for path in written)
+
+    def test_pages_link_to_fingerprinted_assets(self):
+        self.build({"/images/logo.png": "/images/logo.aaaaaa.png"})
+        self.assertIn('src="/images/logo.aaaaaa.png"', read(os.path.join(self.output, "logo.html")))
+
+    def test_only_pages_using_a_changed_asset_are_rebuilt(self):
+        self.assertListEqual(self.build({"/images/logo.png": "/images/logo.aaaaaa.png"}), ["logo.html", "plain.html"])
+        self.assertListEqual(self.build({"/images/logo.png": "/images/logo.aaaaaa.png"}), [])
+        self.assertListEqual(self.build({"/images/logo.png": "/images/logo.bbbbbb.png"}), ["logo.html"])
+        self.assertIn('src="/images/logo.bbbbbb.png"', read(os.path.join(self.output, "logo.html")))
+        self.assertListEqual(self.build({"/images/logo.png": "/images/logo.bbbbbb.png", "/index.html": "/index.cccccc.html"}), ["plain.html"])
+
+    def test_switching_fingerprints_on_and_off(self):
+        self.assertListEqual(self.build(None), ["logo.html", "plain.html"])
+        self.assertListEqual(self.build({}), ["logo.html", "plain.html"])
+        self.assertListEqual(self.build({"/images/logo.png": "/images/logo.aaaaaa.png"}), ["logo.html"])
+        self.assertListEqual(self.build(None), ["logo.html"])
+        self.assertIn('src="/images/logo.png"', read(os.path.join(self.output, "logo.html")))
+
+    def test_worker_processes(self):
+        self.build({"/images/logo.png": "/images/logo.aaaaaa.png"}, workers=2)
+        self.assertListEqual(self.build({"/images/logo.png": "/images/logo.aaaaaa.png"}, workers=2), [])
+
+    def test_cached_trees_are_rewritten(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        self.build({"/images/logo.png": "/images/logo.aaaaaa.png"}, cache_dir=cache_dir)
+        self.build({"/images/logo.png": "/images/logo.bbbbbb.png"}, cache_dir=cache_dir)
+        self.assertIn('src="/images/logo.bbbbbb.png"', read(os.path.join(self.output, "logo.html")))
+
+    def test_rejects_prerendered_html(self):
+        from src.inline_cache import InlineRenderCache
+        with self.assertRaises(ValueError):
+            build_site(self.content, self.output, asset_urls={}, inline_cache=InlineRenderCache())
+
+
+if __name__ == "__main__":
+    unittest.main()
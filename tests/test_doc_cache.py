@@ -0,0 +1,110 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from src import build
+from src.doc_cache import DocumentCache, dump_tree, load_tree, _parser_version, PARSER_VERSION
+from src.block_parser import markdown_to_html_node
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+
+
+class TestTreeSerialization(unittest.TestCase):
+    def test_roundtrip(self):
+        root = markdown_to_html_node("# Title\n\nSome **bold** [link](/a?b=c)\n\n- x\n- ![i](i.png)\n\n```\ncode\n```\n")
+        self.assertEqual(load_tree(dump_tree(root)).to_html(), root.to_html())
+
+    def test_raw_children_and_props(self):
+        root = ParentNode("div", ["<hr>", LeafNode("a", "x", {"href": "/"})], {"class": "c"})
+        loaded = load_tree(dump_tree(root))
+        self.assertEqual(loaded.to_html(), '<div class="c"><hr><a href="/">x</a></div>')
+        self.assertEqual(loaded.props, {"class": "c"})
+
+    def test_empty_parent_kept(self):
+        loaded = load_tree(dump_tree(ParentNode("div", [ParentNode("p", []), LeafNode("b", "x")])))
+        self.assertEqual(loaded.children[0].children, [])
+        self.assertEqual(loaded.children[1].value, "x")
+
+    def test_deep_tree(self):
+        node = LeafNode("b", "x")
+        for _ in range(20000):
+            node = ParentNode("blockquote", [node])
+        self.assertEqual(load_tree(dump_tree(node)).to_html(), node.to_html())
+
+
+class TestDocumentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DocumentCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_miss_then_hit(self):
+        self.assertIsNone(self.cache.get("abc"))
+        self.cache.put("abc", "Title", ParentNode("div", [LeafNode("p", "hi")]))
+        title, node = self.cache.get("abc")
+        self.assertEqual(title, "Title")
+        self.assertEqual(node.to_html(), "<div><p>hi</p></div>")
+
+    def test_corrupt_entry_is_a_miss(self):
+        with open(self.cache.path_for("bad"), "wb") as f:
+            f.write(b"not marshal data")
+        self.assertIsNone(self.cache.get("bad"))
+
+    def test_evicts_least_recently_used(self):
+        node = ParentNode("div", [LeafNode("p", "x" * 2000)])
+        for key in ("a", "b", "c"):
+            self.cache.put(key, "", node)
+        base = time.time() - 100
+        for offset, key in enumerate(("a", "b", "c")):
+            os.utime(self.cache.path_for(key), (base + offset, base + offset))
+        self.cache.get("a")
+        self.cache.max_bytes = os.path.getsize(self.cache.path_for("a")) * 2
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+
+    def test_other_parser_versions_are_dropped(self):
+        stale = os.path.join(self.tmp.name, "0000000000000000-abc.bin")
+        with open(stale, "wb") as f:
+            f.write(b"old")
+        self.cache.put("abc", "", LeafNode("p", "x"))
+        self.cache.evict()
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.basename(self.cache.path_for("abc")).startswith(PARSER_VERSION))
+
+    def test_version_depends_on_interpreter(self):
+        self.assertEqual(_parser_version(), PARSER_VERSION)
+        with mock.patch("sys.version_info", (3, 0, 0)):
+            self.assertNotEqual(_parser_version(), PARSER_VERSION)
+        with mock.patch("marshal.version", -1):
+            self.assertNotEqual(_parser_version(), PARSER_VERSION)
+
+
+class TestBuildWithCache(unittest.TestCase):
+    def test_template_change_skips_parsing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            content = os.path.join(tmp, "content")
+            output = os.path.join(tmp, "public")
+            cache_dir = os.path.join(tmp, "cache")
+            template = os.path.join(tmp, "template.html")
+            os.makedirs(content)
+            with open(os.path.join(content, "index.md"), "w", encoding="utf-8") as f:
+                f.write("# Home\n\nHello\n")
+            with open(template, "w", encoding="utf-8") as f:
+                f.write("<main>{{ Content }}</main>")
+            build.build_site(content, output, template, incremental=True, cache_dir=cache_dir)
+            with open(template, "w", encoding="utf-8") as f:
+                f.write("<title>{{ Title }}</title><article>{{ Content }}</article>")
+            with mock.patch.object(build, "parse_page", side_effect=AssertionError("parsed again")):
+                written = build.build_site(content, output, template, incremental=True, cache_dir=cache_dir)
+            self.assertEqual(len(written), 1)
+            with open(written[0], encoding="utf-8") as f:
+                self.assertEqual(f.read(), "<title>Home</title><article><div><h1>Home</h1><p>Hello</p></div></article>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from src.htmlnode import HTMLNode
+from src.htmlnode import HTMLNode, escape_text, escape_attr
 
 class TestHTMLNode(unittest.TestCase):
     def test_init_defaults(self):
@@ -46,6 +46,36 @@ class TestHTMLNode(unittest.TestCase):
         self.assertIn(' href="https://example.com"', result)
         self.assertIn(' class="nav"', result)
 
+    def test_props_to_html_escapes_values(self):
+        node = HTMLNode("a", "Link", props={"href": '/q?a=1&b="2"', "title": "<x>"})
+        self.assertEqual(
+            node.props_to_html(),
+            ' href="/q?a=1&amp;b=&quot;2&quot;" title="&lt;x&gt;"'
+        )
+
+    def test_props_to_html_reused_props(self):
+        props = {"class": "nav"}
+        first = HTMLNode("a", "Link", props=props).props_to_html()
+        props["class"] = "footer"
+        self.assertEqual(HTMLNode("a", "Link", props=props).props_to_html(), ' class="footer"')
+        self.assertEqual(first, ' class="nav"')
+
+    def test_props_to_html_distinguishes_equal_numbers(self):
+        self.assertEqual(HTMLNode("p", props={"data-x": True}).props_to_html(), ' data-x="True"')
+        self.assertEqual(HTMLNode("p", props={"data-x": 1}).props_to_html(), ' data-x="1"')
+
+    def test_props_to_html_unhashable_value(self):
+        node = HTMLNode("p", props={"data-list": [1, 2]})
+        self.assertEqual(node.props_to_html(), ' data-list="[1, 2]"')
+
+    def test_escape_text(self):
+        self.assertEqual(escape_text("a < b & c > d \"e\""), 'a &lt; b &amp; c &gt; d "e"')
+        self.assertEqual(escape_text("plain"), "plain")
+
+    def test_escape_attr(self):
+        self.assertEqual(escape_attr('say "hi" & <bye>'), "say &quot;hi&quot; &amp; &lt;bye&gt;")
+        self.assertEqual(escape_attr(42), "42")
+
     def test_repr(self):
         node = HTMLNode("p", "Hello", None, {"class": "text"})
         self.assertEqual(
@@ -58,5 +88,16 @@ class TestHTMLNode(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             node.to_html()
 
+    def test_iter_html_not_implemented(self):
+        node = HTMLNode("p", "Hello")
+        with self.assertRaises(NotImplementedError):
+            list(node.iter_html())
+
+    def test_no_instance_dict(self):
+        node = HTMLNode("p", "Hello")
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import os
+import pickle
+import tempfile
+import unittest
+from src.block_parser import markdown_to_html_node
+from src.build import build_site
+from src.inline_cache import InlineRenderCache
+from tests.helpers import read, write
+
+
+class TestInlineRenderCache(unittest.TestCase):
+    def test_render_and_counters(self):
+        cache = InlineRenderCache()
+        self.assertEqual(cache.render("a **b** [c](/d)"), 'a <b>b</b> <a href="/d">c</a>')
+        cache.render("a **b** [c](/d)")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.stats()["hit_rate"], 0.5)
+
+    def test_children_of_empty_text(self):
+        self.assertListEqual(InlineRenderCache().children(""), [])
+
+    def test_lru_eviction(self):
+        cache = InlineRenderCache(max_entries=2)
+        cache.render("a")
+        cache.render("b")
+        cache.render("a")
+        cache.render("c")
+        self.assertEqual(len(cache), 2)
+        self.assertIn("a", cache.entries)
+        self.assertNotIn("b", cache.entries)
+
+    def test_errors_are_not_cached(self):
+        cache = InlineRenderCache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.render("a **b")
+        self.assertEqual(len(cache), 0)
+
+    def test_same_html_as_uncached(self):
+        markdown = "# T _x_\n\n- a **b**\n- a **b**\n\n1. `c`\n2. d\n\n> q\n> r\n\nsome & <text>\n\n```\ncode\n```"
+        cache = InlineRenderCache()
+        self.assertEqual(markdown_to_html_node(markdown, cache.children).to_html(), markdown_to_html_node(markdown).to_html())
+        self.assertEqual(cache.hits, 1)
+
+    def test_pickle_drops_entries(self):
+        cache = InlineRenderCache(max_entries=7)
+        cache.render("a")
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((copy.max_entries, len(copy), copy.hits, copy.misses), (7, 0, 0, 0))
+
+
+class TestBuildWithInlineCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        for index in range(4):
+            write(os.path.join(self.content, f"page{index}.md"), f"# Page {index}\n\n- [Home](/)\n- shared **item**\n- shared **item**\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check_build(self, workers):
+        plain = os.path.join(self.tmp.name, "plain")
+        cached = os.path.join(self.tmp.name, "cached")
+        build_site(self.content, plain)
+        cache = InlineRenderCache()
+        build_site(self.content, cached, workers=workers, inline_cache=cache)
+        for index in range(4):
+            name = f"page{index}.html"
+            self.assertEqual(read(os.path.join(plain, name)), read(os.path.join(cached, name)))
+        self.assertEqual(cache.hits + cache.misses, 16)
+        return cache
+
+    def test_sequential_build(self):
+        cache = self.check_build(workers=1)
+        self.assertEqual((cache.hits, cache.misses), (10, 6))
+
+    def test_worker_counts_are_collected(self):
+        cache = self.check_build(workers=2)
+        self.assertGreaterEqual(cache.hits, 4)
+
+    def test_workers_keep_their_cache_across_chunks(self):
+        for index in range(16):
+            write(os.path.join(self.content, f"page{index}.md"), f"# Page {index}\n\nshared footer text\n")
+        cache = InlineRenderCache()
+        build_site(self.content, os.path.join(self.tmp.name, "public"), workers=2, inline_cache=cache)
+        # 16 distinct headings; the footer is rendered at most once per
+        # worker although the pages go out in 8 chunks.
+        self.assertEqual(cache.hits + cache.misses, 32)
+        self.assertLessEqual(cache.misses, 18)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import re
+import unittest
+from src.textnode import TextNode, TextType
+from src.inline_tokenizer import text_to_textnodes
+from src.inline_pipeline import (
+    InlinePipeline,
+    delimiter_pass,
+    image_pass,
+    link_pass,
+    run_inline_passes,
+)
+from src.util_functions import split_nodes_delimiter, split_nodes_image, split_nodes_link
+
+
+FOOTNOTE_PATTERN = re.compile(r"\[\^(\w+)\]")
+
+
+def footnote_pass(node):
+    pos = 0
+    for match in FOOTNOTE_PATTERN.finditer(node.text):
+        if match.start() > pos:
+            yield TextNode(node.text[pos:match.start()], TextType.TEXT)
+        yield TextNode(match.group(1), TextType.LINK, f"#fn-{match.group(1)}")
+        pos = match.end()
+    if pos < len(node.text):
+        yield TextNode(node.text[pos:], TextType.TEXT)
+
+
+class TestRunInlinePasses(unittest.TestCase):
+    def test_matches_list_splitters(self):
+        text = "**a** and _b_ with `c` ![d](e) [f](g)"
+        passes = [
+            delimiter_pass("**", TextType.BOLD),
+            delimiter_pass("_", TextType.ITALIC),
+            delimiter_pass("`", TextType.CODE),
+            image_pass,
+            link_pass,
+        ]
+        nodes = [TextNode(text, TextType.TEXT)]
+        expected = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+        expected = split_nodes_delimiter(expected, "_", TextType.ITALIC)
+        expected = split_nodes_delimiter(expected, "`", TextType.CODE)
+        expected = split_nodes_link(split_nodes_image(expected))
+        self.assertListEqual(list(run_inline_passes(nodes, passes)), expected)
+
+    def test_non_text_nodes_skip_passes(self):
+        seen = []
+
+        def recording_pass(node):
+            seen.append(node.text)
+            return [node]
+
+        nodes = [TextNode("a", TextType.TEXT), TextNode("b", TextType.CODE), TextNode("c", TextType.TEXT)]
+        result = list(run_inline_passes(nodes, [recording_pass, recording_pass]))
+        self.assertListEqual(result, nodes)
+        self.assertListEqual(seen, ["a", "a", "c", "c"])
+
+    def test_is_lazy(self):
+        def source():
+            yield TextNode("**a**", TextType.TEXT)
+            raise AssertionError("consumed too far")
+
+        stream = run_inline_passes(source(), [delimiter_pass("**", TextType.BOLD)])
+        self.assertEqual(next(stream), TextNode("a", TextType.BOLD))
+
+    def test_no_passes(self):
+        nodes = [TextNode("**a**", TextType.TEXT)]
+        self.assertListEqual(list(run_inline_passes(nodes, [])), nodes)
+
+
+class TestInlinePipeline(unittest.TestCase):
+    def test_default_matches_tokenizer(self):
+        text = "Some **bold**, _italic_, `code`, ![img](a.png) and [link](b)"
+        self.assertListEqual(InlinePipeline().text_to_textnodes(text), text_to_textnodes(text))
+
+    def test_registered_pass(self):
+        pipeline = InlinePipeline()
+        pipeline.register(footnote_pass)
+        self.assertListEqual(
+            pipeline.text_to_textnodes("**Note**[^1] see [docs](/d)"),
+            [
+                TextNode("Note", TextType.BOLD),
+                TextNode("1", TextType.LINK, "#fn-1"),
+                TextNode(" see ", TextType.TEXT),
+                TextNode("docs", TextType.LINK, "/d"),
+            ],
+        )
+
+    def test_register_at_index(self):
+        pipeline = InlinePipeline([link_pass])
+        pipeline.register(image_pass, index=0)
+        self.assertListEqual(pipeline.passes, [image_pass, link_pass])
+
+
+if __name__ == "__main__":
+    unittest.main()
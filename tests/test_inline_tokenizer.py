@@ -0,0 +1,187 @@
+import unittest
+from src.textnode import TextNode, TextType, SpanTextNode
+from src.inline_tokenizer import scan_inline, split_nodes_inline, split_text_node, text_to_textnodes
+from src.util_functions import split_nodes_delimiter, split_nodes_image, split_nodes_link
+
+
+class TestTextToTextNodes(unittest.TestCase):
+    def test_all_inline_types(self):
+        text = (
+            "This is **text** with an _italic_ word and a `code block` and an "
+            "![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
+        )
+        expected = [
+            TextNode("This is ", TextType.TEXT),
+            TextNode("text", TextType.BOLD),
+            TextNode(" with an ", TextType.TEXT),
+            TextNode("italic", TextType.ITALIC),
+            TextNode(" word and a ", TextType.TEXT),
+            TextNode("code block", TextType.CODE),
+            TextNode(" and an ", TextType.TEXT),
+            TextNode("obi wan image", TextType.IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
+            TextNode(" and a ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "https://boot.dev"),
+        ]
+        self.assertListEqual(text_to_textnodes(text), expected)
+
+    def test_matches_chained_passes(self):
+        text = "**a** then `b` then _c_ ![d](e.png) and [f](g) end"
+        nodes = [TextNode(text, TextType.TEXT)]
+        nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+        nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
+        nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+        nodes = split_nodes_image(nodes)
+        nodes = split_nodes_link(nodes)
+        self.assertListEqual(text_to_textnodes(text), nodes)
+
+    def test_plain_text(self):
+        self.assertListEqual(text_to_textnodes("plain"), [TextNode("plain", TextType.TEXT)])
+
+    def test_empty_text(self):
+        self.assertListEqual(text_to_textnodes(""), [])
+
+    def test_empty_text_node(self):
+        node = TextNode("", TextType.TEXT)
+        self.assertListEqual(split_nodes_image([node]), [node])
+        self.assertListEqual(split_nodes_link([node]), [node])
+        self.assertListEqual(split_nodes_delimiter([node], "**", TextType.BOLD), [])
+        span = SpanTextNode("ab", 1, 1, TextType.TEXT)
+        self.assertListEqual(split_nodes_image([span]), [span])
+        self.assertListEqual(split_nodes_link([span]), [span])
+
+    def test_bang_inside_previous_token_is_not_an_image_marker(self):
+        # The "!" closing the highlight token right before "[" belongs to
+        # that token, so what follows is a link, as with the chained
+        # splitters.
+        delimiters = (("!!", TextType.BOLD),)
+        for text in ("!!hi!![a](b)", "`x!`[a](b)", "x !!y!![a](b)"):
+            with self.subTest(text=text):
+                nodes = split_nodes_delimiter([TextNode(text, TextType.TEXT)], "`", TextType.CODE)
+                nodes = split_nodes_delimiter(nodes, "!!", TextType.BOLD)
+                nodes = split_nodes_image(nodes)
+                nodes = split_nodes_link(nodes)
+                self.assertEqual(nodes[-1], TextNode("a", TextType.LINK, "b"))
+                self.assertListEqual(
+                    split_nodes_inline([TextNode(text, TextType.TEXT)], (("`", TextType.CODE),) + delimiters),
+                    nodes,
+                )
+
+    def test_nodes_are_spans_over_the_text(self):
+        text = "Some **bold** and [a link](/x)"
+        for node in text_to_textnodes(text):
+            self.assertIsInstance(node, SpanTextNode)
+            self.assertIs(node.source, text)
+
+    def test_underscore_inside_link_url_is_not_italic(self):
+        self.assertListEqual(
+            text_to_textnodes("see [docs](https://a.com/user_guide_v2)"),
+            [
+                TextNode("see ", TextType.TEXT),
+                TextNode("docs", TextType.LINK, "https://a.com/user_guide_v2"),
+            ],
+        )
+
+    def test_delimiter_content_is_literal(self):
+        self.assertListEqual(
+            text_to_textnodes("`a **b** [c](d)`"),
+            [TextNode("a **b** [c](d)", TextType.CODE)],
+        )
+
+    def test_unclosed_delimiter_raises(self):
+        with self.assertRaises(ValueError):
+            text_to_textnodes("**bold and `code`")
+
+    def test_unmatched_bracket_is_text(self):
+        self.assertListEqual(
+            text_to_textnodes("a [b] c [d](e)"),
+            [
+                TextNode("a [b] c ", TextType.TEXT),
+                TextNode("d", TextType.LINK, "e"),
+            ],
+        )
+
+    def test_many_links(self):
+        text = "x [a](b)" * 20000
+        nodes = text_to_textnodes(text)
+        self.assertEqual(len(nodes), 40000)
+        self.assertEqual(nodes[-1], TextNode("a", TextType.LINK, "b"))
+
+
+class TestScanInline(unittest.TestCase):
+    def test_spans_respect_bounds(self):
+        text = "xx**b** [l](u)yy"
+        spans = list(scan_inline(text, 2, len(text) - 2))
+        self.assertListEqual(
+            spans,
+            [
+                (4, 5, TextType.BOLD, None),
+                (7, 8, TextType.TEXT, None),
+                (9, 10, TextType.LINK, "u"),
+            ],
+        )
+
+    def test_longest_delimiter_wins_tie(self):
+        delimiters = (("*", TextType.ITALIC), ("**", TextType.BOLD))
+        self.assertListEqual(
+            list(scan_inline("**b**", delimiters=delimiters)),
+            [(2, 3, TextType.BOLD, None)],
+        )
+
+
+class TestSplitNodesInline(unittest.TestCase):
+    def test_unchanged_node_is_reused(self):
+        node = TextNode("nothing here", TextType.TEXT)
+        self.assertIs(split_text_node(node)[0], node)
+
+    def test_non_text_nodes_passthrough(self):
+        nodes = [TextNode("**x**", TextType.CODE), TextNode("_y_", TextType.TEXT)]
+        self.assertListEqual(
+            split_nodes_inline(nodes),
+            [TextNode("**x**", TextType.CODE), TextNode("y", TextType.ITALIC)],
+        )
+
+    def test_link_after_identical_image(self):
+        node = TextNode("![a](b) [a](b)", TextType.TEXT)
+        self.assertListEqual(
+            split_nodes_link([node]),
+            [
+                TextNode("![a](b) ", TextType.TEXT),
+                TextNode("a", TextType.LINK, "b"),
+            ],
+        )
+
+
+class TestSpanTextNodeSplitting(unittest.TestCase):
+    def test_split_produces_spans_over_same_source(self):
+        source = "header\nSome **bold** and [a link](/x) here\nfooter"
+        start = source.index("Some")
+        end = source.index("\nfooter")
+        nodes = split_nodes_inline([SpanTextNode(source, start, end, TextType.TEXT)])
+        self.assertListEqual(
+            nodes,
+            [
+                TextNode("Some ", TextType.TEXT),
+                TextNode("bold", TextType.BOLD),
+                TextNode(" and ", TextType.TEXT),
+                TextNode("a link", TextType.LINK, "/x"),
+                TextNode(" here", TextType.TEXT),
+            ],
+        )
+        for node in nodes:
+            self.assertIsInstance(node, SpanTextNode)
+            self.assertIs(node.source, source)
+
+    def test_image_marker_outside_span_is_ignored(self):
+        source = "![a](b)"
+        nodes = split_nodes_link([SpanTextNode(source, 1, len(source), TextType.TEXT)])
+        self.assertListEqual(nodes, split_nodes_link([TextNode("[a](b)", TextType.TEXT)]))
+        self.assertListEqual(nodes, [TextNode("a", TextType.LINK, "b")])
+
+    def test_wrappers_accept_span_nodes(self):
+        source = "`code` rest"
+        nodes = split_nodes_delimiter([SpanTextNode(source, 0, len(source), TextType.TEXT)], "`", TextType.CODE)
+        self.assertListEqual(nodes, [TextNode("code", TextType.CODE), TextNode(" rest", TextType.TEXT)])
+
+
+if __name__ == "__main__":
+    unittest.main()
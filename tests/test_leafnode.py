@@ -1,5 +1,7 @@
+import io
 import unittest
-from src.leafnode import LeafNode
+import pickle
+from src.leafnode import LeafNode, FrozenLeafNode
 
 class TestLeafnode(unittest.TestCase):
     def test_text_only_node(self):
@@ -33,6 +35,15 @@ class TestLeafnode(unittest.TestCase):
         self.assertIn('class="btn"', html)
         self.assertTrue(html.endswith(">Click</a>"))
 
+    def test_value_is_escaped(self):
+        node = LeafNode("code", "if a < b && c > d:")
+        self.assertEqual(node.to_html(), "<code>if a &lt; b &amp;&amp; c &gt; d:</code>")
+        self.assertEqual(LeafNode(None, "Q&A").to_html(), "Q&amp;A")
+
+    def test_void_element_without_value(self):
+        node = LeafNode("img", "", {"src": "a.png", "alt": "A"})
+        self.assertEqual(node.to_html(), '<img src="a.png" alt="A">')
+
     def test_missing_value_raises(self):
         node = LeafNode("p", None)
         with self.assertRaises(ValueError):
@@ -58,6 +69,48 @@ class TestLeafnode(unittest.TestCase):
         node = LeafNode("p", "Hello")
         self.assertEqual(node.props_to_html(), "")
 
+    def test_iter_html_single_chunk(self):
+        node = LeafNode("b", "bold")
+        self.assertListEqual(list(node.iter_html()), ["<b>bold</b>"])
+
+    def test_write_to(self):
+        node = LeafNode("a", "link", {"href": "https://example.com"})
+        fp = io.StringIO()
+        node.write_to(fp)
+        self.assertEqual(fp.getvalue(), node.to_html())
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(LeafNode("p", "Hello"), "__dict__"))
+
+
+class TestFrozenLeafNode(unittest.TestCase):
+    def test_hash_ignores_props_order(self):
+        node1 = FrozenLeafNode("img", "", {"src": "a.png", "alt": "a"})
+        node2 = FrozenLeafNode("img", "", {"alt": "a", "src": "a.png"})
+        self.assertEqual(node1, node2)
+        self.assertEqual(hash(node1), hash(node2))
+
+    def test_equal_to_mutable_node(self):
+        self.assertEqual(FrozenLeafNode("b", "x"), LeafNode("b", "x"))
+        self.assertNotEqual(FrozenLeafNode("b", "x"), LeafNode("i", "x"))
+
+    def test_props_are_copied_and_read_only(self):
+        props = {"href": "/a"}
+        node = FrozenLeafNode("a", "link", props)
+        props["href"] = "/b"
+        self.assertEqual(node.to_html(), '<a href="/a">link</a>')
+        with self.assertRaises(TypeError):
+            node.props["href"] = "/c"
+        with self.assertRaises(AttributeError):
+            node.value = "other"
+
+    def test_repr_matches_leafnode(self):
+        self.assertEqual(repr(FrozenLeafNode("p", "Hello", {"class": "text"})), "LeafNode: p, Hello, {'class': 'text'}")
+
+    def test_pickle_roundtrip(self):
+        node = FrozenLeafNode("a", "link", {"href": "/a"})
+        self.assertEqual(pickle.loads(pickle.dumps(node)), node)
+
 
 if __name__ == "__main__":
     unittest.main()    
\ No newline at end of file
@@ -0,0 +1,40 @@
+import gc
+import unittest
+from src.textnode import TextNode, TextType, FrozenTextNode
+from src.leafnode import LeafNode, FrozenLeafNode
+from src.node_intern import intern_text_node, intern_leaf_node, intern_node, interned_count
+
+
+class TestNodeIntern(unittest.TestCase):
+    def test_equal_text_nodes_share_instance(self):
+        node1 = intern_text_node("Read more", TextType.LINK, "/more")
+        node2 = intern_text_node("Read more", TextType.LINK, "/more")
+        self.assertIs(node1, node2)
+        self.assertIsInstance(node1, FrozenTextNode)
+
+    def test_equal_leaf_nodes_share_instance(self):
+        node1 = intern_leaf_node("a", "Home", {"href": "/", "class": "nav"})
+        node2 = intern_leaf_node("a", "Home", {"class": "nav", "href": "/"})
+        self.assertIs(node1, node2)
+        self.assertIsInstance(node1, FrozenLeafNode)
+
+    def test_intern_node_dispatch(self):
+        text = intern_node(TextNode("footer", TextType.TEXT))
+        leaf = intern_node(LeafNode("b", "footer"))
+        self.assertIs(text, intern_text_node("footer", TextType.TEXT))
+        self.assertIs(leaf, intern_leaf_node("b", "footer"))
+        with self.assertRaises(TypeError):
+            intern_node("footer")
+
+    def test_unreferenced_nodes_are_released(self):
+        gc.collect()
+        before = interned_count()
+        node = intern_text_node("transient text", TextType.TEXT)
+        self.assertEqual(interned_count(), before + 1)
+        del node
+        gc.collect()
+        self.assertEqual(interned_count(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
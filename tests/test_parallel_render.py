@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from src.block_parser import iter_blocks, markdown_to_html_node
+from src.build import build_site
+from src.parallel_render import iter_block_chunks, markdown_to_html_node_parallel
+
+DOCUMENT = "\n\n".join([
+    "# Changelog",
+    "## 1.0 _first_",
+    "```\ncode with a blank line\n\nstill code **not bold**\n```",
+    "- item **one**\n- item [two](/two)",
+    "1. first\n2. second",
+    "> quoted\n> text & <more>",
+    "a paragraph\nover two lines with ![img](/i.png)",
+] * 20)
+
+
+class TestParallelRender(unittest.TestCase):
+    def test_chunks_keep_whole_blocks(self):
+        blocks = list(iter_blocks(DOCUMENT.split("\n")))
+        chunks = list(iter_block_chunks(blocks, 100))
+        self.assertGreater(len(chunks), 10)
+        self.assertListEqual([block for chunk in chunks for block in chunk], blocks)
+
+    def test_same_html_in_threads(self):
+        expected = markdown_to_html_node(DOCUMENT).to_html()
+        with ThreadPoolExecutor(3) as executor:
+            for chunk_bytes in (1, 50, 1000, 10 ** 9):
+                with self.subTest(chunk_bytes=chunk_bytes):
+                    node = markdown_to_html_node_parallel(DOCUMENT, executor, chunk_bytes, max_pending=2)
+                    self.assertEqual(node.to_html(), expected)
+
+    def test_same_html_in_processes(self):
+        with ProcessPoolExecutor(2) as executor:
+            node = markdown_to_html_node_parallel(DOCUMENT, executor, 200)
+        self.assertEqual(node.to_html(), markdown_to_html_node(DOCUMENT).to_html())
+
+    def test_errors_are_raised(self):
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(ValueError):
+                markdown_to_html_node_parallel(DOCUMENT + "\n\nunclosed **bold", executor, 100)
+
+    def test_empty_document(self):
+        with ThreadPoolExecutor(1) as executor:
+            with self.assertRaises(ValueError):
+                markdown_to_html_node_parallel("", executor).to_html()
+
+    def test_build_site_splits_large_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            content = os.path.join(tmp, "content")
+            os.makedirs(content)
+            for name, text in (("big.md", DOCUMENT), ("small.md", "# Small\n\ntext")):
+                with open(os.path.join(content, name), "w", encoding="utf-8") as f:
+                    f.write(text)
+            build_site(content, os.path.join(tmp, "plain"))
+            written = build_site(content, os.path.join(tmp, "split"), workers=2, split_bytes=1000, chunk_bytes=300)
+            self.assertEqual(len(written), 2)
+            for name in ("big.html", "small.html"):
+                with open(os.path.join(tmp, "plain", name), "rb") as f:
+                    plain = f.read()
+                with open(os.path.join(tmp, "split", name), "rb") as f:
+                    self.assertEqual(f.read(), plain)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import io
 import unittest
 from src.parentnode import ParentNode
 from src.leafnode import LeafNode
@@ -67,6 +68,51 @@ class TestParentNode(unittest.TestCase):
         with self.assertRaises(ValueError):
             parent.to_html()
 
+    def test_iter_html_streams_chunks(self):
+        parent = ParentNode("div", [LeafNode("span", "a"), "b", ParentNode("p", [LeafNode(None, "c")])])
+        self.assertListEqual(
+            list(parent.iter_html()),
+            ["<div>", "<span>a</span>", "b", "<p>", "c", "</p>", "</div>"],
+        )
+
+    def test_write_to_matches_to_html(self):
+        parent = ParentNode("div", [LeafNode("b", "x"), ParentNode("ul", [LeafNode("li", "y")])], {"id": "main"})
+        fp = io.StringIO()
+        parent.write_to(fp)
+        self.assertEqual(fp.getvalue(), parent.to_html())
+
+    def test_iter_html_raises_on_invalid_descendant(self):
+        parent = ParentNode("div", [ParentNode("p", [])])
+        with self.assertRaises(ValueError):
+            list(parent.iter_html())
+
+    def test_deeply_nested_tree(self):
+        depth = 100000
+        node = LeafNode("b", "x")
+        for _ in range(depth):
+            node = ParentNode("div", [node])
+        html = node.to_html()
+        self.assertTrue(html.startswith("<div>" * depth + "<b>x</b></div>"))
+        self.assertEqual(len(html), depth * len("<div></div>") + len("<b>x</b>"))
+
+    def test_deep_invalid_node_raises(self):
+        node = ParentNode("p", None)
+        for _ in range(5000):
+            node = ParentNode("div", [node])
+        with self.assertRaises(ValueError):
+            node.to_html()
+
+    def test_overridden_iter_html_is_used(self):
+        class Comment(ParentNode):
+            def iter_html(self):
+                yield "<!-- c -->"
+
+        parent = ParentNode("div", [Comment("x", ["y"])])
+        self.assertEqual(parent.to_html(), "<div><!-- c --></div>")
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(ParentNode("div", []), "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
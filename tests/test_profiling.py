@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from src import block_parser
+from src.build import build_chunk, build_site, use_template
+from src.inline_cache import InlineRenderCache
+from src.profiling import BuildProfile, PageRecorder, count_nodes, timed_inline
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+from tests.helpers import read, write
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        write(os.path.join(self.content, "index.md"), "# Home\n\nWelcome to **the** site\n")
+        write(os.path.join(self.content, "big.md"), "# Big\n\n" + "\n\n".join(f"para _{i}_ [x](/y)" for i in range(300)))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_output_matches_unprofiled_build(self):
+        plain = os.path.join(self.tmp.name, "plain")
+        profiled = os.path.join(self.tmp.name, "profiled")
+        build_site(self.content, plain)
+        written = build_site(self.content, profiled, profile=BuildProfile())
+        self.assertEqual(sorted(os.path.basename(path) for path in written), ["big.html", "index.html"])
+        for name in ("index.html", "big.html"):
+            self.assertEqual(read(os.path.join(plain, name)), read(os.path.join(profiled, name)))
+
+    def test_report(self):
+        profile = BuildProfile(top=1)
+        build_site(self.content, os.path.join(self.tmp.name, "public"), profile=profile)
+        report = profile.report()
+        self.assertEqual(report["pages"], 2)
+        self.assertListEqual(list(report["stages"]), ["read", "parse", "inline", "convert", "to_html", "write"])
+        self.assertEqual(report["stages"]["inline"]["calls"], 303)
+        self.assertGreater(report["stages"]["parse"]["peak_bytes"], 0)
+        self.assertEqual(len(report["slowest"]), 1)
+        self.assertTrue(report["slowest"][0]["page"].endswith("big.md"))
+        self.assertGreater(report["slowest"][0]["nodes"]["html"], 300)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        path = os.path.join(self.tmp.name, "profile.json")
+        profile.write(path)
+        self.assertEqual(json.loads(read(path))["pages"], 2)
+
+    def test_without_memory(self):
+        profile = BuildProfile(memory=False)
+        build_site(self.content, os.path.join(self.tmp.name, "public"), profile=profile)
+        self.assertEqual(profile.report()["stages"]["parse"]["peak_bytes"], 0)
+
+    def test_nested_stage_peak(self):
+        tracemalloc.start()
+        try:
+            recorder = PageRecorder("page")
+            with recorder.stage("outer"):
+                with recorder.stage("inner"):
+                    data = bytearray(1_000_000)
+                    del data
+        finally:
+            tracemalloc.stop()
+        self.assertGreaterEqual(recorder.stages["inner"]["peak_bytes"], 1_000_000)
+        self.assertGreaterEqual(recorder.stages["outer"]["peak_bytes"], 1_000_000)
+
+    def test_timed_inline(self):
+        original = block_parser.text_to_children
+        recorder = PageRecorder("page", memory=False)
+        root = block_parser.markdown_to_html_node("a **b**", timed_inline(recorder))
+        self.assertEqual(root.to_html(), block_parser.markdown_to_html_node("a **b**").to_html())
+        self.assertIs(block_parser.text_to_children, original)
+        block_parser.text_to_children("not recorded")
+        self.assertEqual(recorder.nodes["text"], 2)
+        self.assertEqual(recorder.stages["inline"]["calls"], 1)
+        self.assertEqual(recorder.stages["convert"]["calls"], 1)
+
+    def test_timed_inline_with_cache(self):
+        recorder = PageRecorder("page", memory=False)
+        inline = timed_inline(recorder, InlineRenderCache())
+        self.assertListEqual(inline("a **b**"), inline("a **b**"))
+        self.assertEqual(recorder.stages["inline"]["calls"], 1)
+
+    def test_chunk_stops_tracing(self):
+        templates = {}
+        use_template(templates, None)
+        job = (os.path.join(self.content, "index.md"), os.path.join(self.tmp.name, "index.html"), None, None)
+        (_, record), = build_chunk([job], templates, profile_memory=True)[0]
+        self.assertGreater(record["stages"]["parse"]["peak_bytes"], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_count_nodes(self):
+        root = ParentNode("div", [ParentNode("p", [LeafNode(None, "a"), LeafNode("b", "c")]), "raw"])
+        self.assertEqual(count_nodes(root), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
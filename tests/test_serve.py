@@ -0,0 +1,93 @@
+import os
+import tempfile
+import threading
+import unittest
+import urllib.request
+from src.serve import SiteWatcher, start_server, watch
+from tests.helpers import read, write
+
+
+class TestSiteWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.content = os.path.join(root, "content")
+        self.output = os.path.join(root, "public")
+        self.template = os.path.join(root, "templates", "default.html")
+        write(self.template, "{{> nav.html }}{{ Content }}")
+        write(os.path.join(root, "templates", "nav.html"), "<nav></nav>")
+        write(os.path.join(root, "templates", "unused.html"), "unused")
+        write(os.path.join(self.content, "index.md"), "# Home\n")
+        write(os.path.join(self.content, "about.md"), "# About\n")
+        self.watcher = SiteWatcher(self.content, self.output, self.template)
+        self.watcher.full_build()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_no_changes(self):
+        self.assertListEqual(self.watcher.poll(), [])
+
+    def test_edited_page_only(self):
+        write(os.path.join(self.content, "about.md"), "# About us\n")
+        self.assertListEqual(self.watcher.poll(), [os.path.join(self.output, "about.html")])
+        self.assertEqual(read(os.path.join(self.output, "about.html")), "<nav></nav><div><h1>About us</h1></div>")
+        self.assertListEqual(self.watcher.poll(), [])
+
+    def test_added_and_removed_pages(self):
+        write(os.path.join(self.content, "new.md"), "# New\n")
+        os.remove(os.path.join(self.content, "index.md"))
+        self.assertListEqual(self.watcher.poll(), [os.path.join(self.output, "new.html")])
+        self.assertFalse(os.path.exists(os.path.join(self.output, "index.html")))
+
+    def test_partial_change_rebuilds_pages(self):
+        write(os.path.join(self.tmp.name, "templates", "nav.html"), "<nav>new</nav>")
+        self.assertEqual(len(self.watcher.poll()), 2)
+        self.assertIn("<nav>new</nav>", read(os.path.join(self.output, "index.html")))
+
+    def test_unused_template_is_not_watched(self):
+        write(os.path.join(self.tmp.name, "templates", "unused.html"), "changed")
+        self.assertListEqual(self.watcher.poll(), [])
+
+    def test_broken_page_reported_once(self):
+        write(os.path.join(self.content, "about.md"), "**unclosed\n")
+        self.assertListEqual(self.watcher.poll(), [])
+        self.assertEqual(len(self.watcher.errors), 1)
+        self.watcher.errors.clear()
+        self.watcher.poll()
+        self.assertListEqual(self.watcher.errors, [])
+
+
+class TestServer(unittest.TestCase):
+    def test_serves_rebuilt_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            content = os.path.join(tmp, "content")
+            output = os.path.join(tmp, "public")
+            write(os.path.join(content, "index.md"), "# Home\n")
+            watcher = SiteWatcher(content, output)
+            watcher.full_build()
+            server = start_server(output, port=0)
+            stop = threading.Event()
+            reports = []
+            thread = threading.Thread(target=watch, args=(watcher, 0.01, reports.append, stop))
+            thread.start()
+            try:
+                url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+                with urllib.request.urlopen(url) as response:
+                    self.assertIn(b"<h1>Home</h1>", response.read())
+                write(os.path.join(content, "index.md"), "# Changed home\n")
+                for _ in range(200):
+                    if reports:
+                        break
+                    stop.wait(0.01)
+                with urllib.request.urlopen(url) as response:
+                    self.assertIn(b"<h1>Changed home</h1>", response.read())
+            finally:
+                stop.set()
+                thread.join()
+                server.shutdown()
+                server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import io
+import os
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from src.build import build_site, find_pages, PageError
+from src.stream_build import MemoryBudget, StreamingBuild, iter_pages, stream_build_site
+from tests.helpers import read, write
+
+
+def markdown_for(page):
+    return f"# {page}\n\n" + "\n\n".join(f"paragraph {i} of {page} with **bold** and [a link](/{i})" for i in range(3))
+
+
+class NullOutput(io.StringIO):
+    # Counts what is written without keeping it.
+    written = 0
+
+    def write(self, text):
+        NullOutput.written += len(text)
+        return len(text)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+
+class TestStreamBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        for index in range(30):
+            write(os.path.join(self.content, f"d{index % 4}", f"p{index}.md"), markdown_for(index))
+        write(os.path.join(self.content, "index.md"), "# Home\n\nhi\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_same_output_as_build_site(self):
+        expected = os.path.join(self.tmp.name, "expected")
+        output = os.path.join(self.tmp.name, "public")
+        build_site(self.content, expected)
+        self.assertEqual(stream_build_site(self.content, output, queue_size=2, memory_limit=4096), 31)
+        for page in iter_pages(self.content):
+            name = os.path.splitext(page)[0] + ".html"
+            self.assertEqual(read(os.path.join(output, name)), read(os.path.join(expected, name)))
+
+    def test_iter_pages(self):
+        self.assertListEqual(sorted(iter_pages(self.content)), find_pages(self.content))
+
+    def test_errors_stop_the_build(self):
+        write(os.path.join(self.content, "d0", "bad.md"), "# Bad\n\nunclosed **bold\n")
+        with self.assertRaises(PageError) as raised:
+            stream_build_site(self.content, os.path.join(self.tmp.name, "public"), queue_size=1)
+        self.assertEqual(raised.exception.source_path, os.path.join("d0", "bad.md"))
+        self.assertIsInstance(raised.exception.__cause__, ValueError)
+
+    def test_failed_page_leaves_no_partial_output(self):
+        output = os.path.join(self.tmp.name, "public")
+        write(os.path.join(self.content, "d0", "bad.md"), "# Bad\n\n>\n")
+        with self.assertRaises(PageError):
+            stream_build_site(self.content, output, queue_size=1)
+        self.assertFalse(any(name.startswith("bad.html") for name in os.listdir(os.path.join(output, "d0"))))
+
+    def test_writer_errors_stop_the_build(self):
+        def open_output(page):
+            raise OSError("disk full")
+
+        build = StreamingBuild(markdown_for, open_output, queue_size=1)
+        with self.assertRaises(PageError) as raised:
+            build.run(range(1000))
+        self.assertIsInstance(raised.exception.__cause__, OSError)
+        self.assertEqual(threading.active_count(), 1)
+
+    def test_memory_budget(self):
+        budget = MemoryBudget(100)
+        stop = threading.Event()
+        self.assertTrue(budget.acquire(60, stop))
+        stop.set()
+        self.assertFalse(budget.acquire(60, stop))
+        budget.release(60)
+        self.assertTrue(budget.acquire(500, stop))
+        self.assertEqual(budget.peak, 500)
+
+    def peak_memory(self, pages):
+        build = StreamingBuild(markdown_for, lambda page: NullOutput(), queue_size=4, memory_limit=64 * 1024)
+        tracemalloc.start()
+        try:
+            self.assertEqual(build.run(range(pages)), pages)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLessEqual(build.budget.peak, 64 * 1024)
+        return peak
+
+    def test_peak_memory_is_flat(self):
+        small = self.peak_memory(200)
+        large = self.peak_memory(2000)
+        self.assertLess(large, small * 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import pickle
+import unittest
+from src.htmlnode import HTMLNode
+from src.leafnode import FrozenLeafNode, LeafNode
+from src.parentnode import ParentNode
+from src.subtree_cache import CachedParentNode, cache_html
+
+
+def nav():
+    return ParentNode("nav", [
+        LeafNode("a", "Home", {"href": "/"}),
+        ParentNode("ul", [ParentNode("li", [LeafNode(None, "one")]), ParentNode("li", [LeafNode("b", "two")])]),
+        FrozenLeafNode("span", "&"),
+        "raw",
+    ], {"class": "site"})
+
+
+class TestSubtreeCache(unittest.TestCase):
+    def test_same_html(self):
+        node = cache_html(nav())
+        self.assertEqual(node.to_html(), nav().to_html())
+        self.assertEqual(node.to_html(), nav().to_html())
+        self.assertEqual("".join(node.iter_html()), nav().to_html())
+
+    def test_renders_once(self):
+        node = cache_html(nav())
+        html = node.to_html()
+        self.assertIs(node.to_html(), html)
+        page = ParentNode("div", [node, LeafNode("p", "body")])
+        self.assertEqual(page.to_html(), f"<div>{html}<p>body</p></div>")
+        self.assertIs(node.to_html(), html)
+
+    def test_classes(self):
+        node = cache_html(nav())
+        self.assertIs(type(node), CachedParentNode)
+        self.assertIs(type(node.children[0]), LeafNode)
+        self.assertIs(type(node.children[1]), ParentNode)
+        self.assertIs(type(node.children[2]), FrozenLeafNode)
+        self.assertIs(type(node.children), list)
+        self.assertIs(type(node.props), dict)
+        self.assertIs(cache_html(node), node)
+        self.assertFalse(hasattr(node, "__dict__"))
+
+    def test_plain_nodes_have_no_cache_slot(self):
+        self.assertNotIn("_html", HTMLNode.__slots__)
+        self.assertFalse(hasattr(LeafNode("b", "x"), "_html"))
+        self.assertFalse(hasattr(ParentNode("p", [LeafNode("b", "x")]), "_html"))
+
+    def test_invalidated_by_changes(self):
+        changes = [
+            lambda node: setattr(node, "props", {"id": "x"}),
+            lambda node: node.props.update({"id": "x"}),
+            lambda node: setattr(node, "tag", "header"),
+            lambda node: node.children.append(LeafNode("i", "new")),
+            lambda node: node.children.pop(),
+            lambda node: node.children.reverse(),
+            lambda node: setattr(node, "children", [LeafNode("i", "only")]),
+            lambda node: setattr(node.children[0], "value", "Start"),
+            lambda node: node.children[0].props.__setitem__("href", "/home"),
+            lambda node: node.children[1].children[0].children.insert(0, LeafNode("b", "zero")),
+            lambda node: node.children[1].children.__setitem__(0, ParentNode("li", [LeafNode(None, "1")])),
+        ]
+        for change in changes:
+            node = cache_html(nav())
+            plain = nav()
+            node.to_html()
+            change(node)
+            change(plain)
+            with self.subTest(change=change):
+                self.assertEqual(node.to_html(), plain.to_html())
+
+    def test_new_children_are_watched(self):
+        node = cache_html(nav())
+        child = ParentNode("p", [LeafNode(None, "a")])
+        node.children.append(child)
+        node.to_html()
+        child.children[0].value = "b"
+        self.assertIn("<p>b</p>", node.to_html())
+
+    def test_generator_children(self):
+        node = cache_html(ParentNode("div", (LeafNode("b", str(i)) for i in range(3))))
+        self.assertEqual(node.to_html(), "<div><b>0</b><b>1</b><b>2</b></div>")
+        self.assertEqual(node.to_html(), "<div><b>0</b><b>1</b><b>2</b></div>")
+
+    def test_unsupported_nodes(self):
+        class Custom(HTMLNode):
+            __slots__ = ()
+
+            def iter_html(self):
+                yield "<custom>"
+
+        with self.assertRaises(TypeError):
+            cache_html(ParentNode("div", [LeafNode("b", "x"), ParentNode("p", [Custom()])]))
+        with self.assertRaises(TypeError):
+            cache_html(LeafNode("b", "x"))
+
+    def test_deep_tree(self):
+        node = LeafNode("b", "x")
+        for _ in range(5000):
+            node = ParentNode("i", [node])
+        self.assertEqual(cache_html(node).to_html(), "<i>" * 5000 + "<b>x</b>" + "</i>" * 5000)
+
+    def test_pickle_drops_html(self):
+        node = cache_html(nav())
+        node.to_html()
+        copy = pickle.loads(pickle.dumps(node))
+        self.assertIs(type(copy), CachedParentNode)
+        self.assertIsNone(copy._html)
+        self.assertEqual(copy.to_html(), nav().to_html())
+
+    def test_trees_are_invalidated_separately(self):
+        first = cache_html(nav())
+        second = cache_html(nav())
+        html = second.to_html()
+        first.to_html()
+        first.children[0].value = "Start"
+        self.assertIn(">Start<", first.to_html())
+        self.assertIs(second.to_html(), html)
+
+    def test_shared_child(self):
+        shared = ParentNode("ul", [LeafNode("li", "a")])
+        first = cache_html(ParentNode("nav", [shared]))
+        second = cache_html(ParentNode("aside", [shared]))
+        first.to_html()
+        second.to_html()
+        shared.children.append(LeafNode("li", "b"))
+        self.assertEqual(first.to_html(), "<nav><ul><li>a</li><li>b</li></ul></nav>")
+        self.assertEqual(second.to_html(), "<aside><ul><li>a</li><li>b</li></ul></aside>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import io
+import os
+import tempfile
+import unittest
+from src.template import load_template, hash_files, CompiledTemplate, compile_template
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+from tests.helpers import write
+
+
+class TestLoadTemplate(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        os.makedirs(os.path.join(self.dir, "partials"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, *parts):
+        return os.path.join(self.dir, *parts)
+
+    def test_inlines_nested_partials(self):
+        write(self.path("page.html"), "<body>{{> partials/nav.html }}{{ Content }}</body>")
+        write(self.path("partials", "nav.html"), "<nav>{{>logo.html}}</nav>")
+        write(self.path("partials", "logo.html"), "LOGO")
+        text, dependencies = load_template(self.path("page.html"))
+        self.assertEqual(text, "<body><nav>LOGO</nav>{{ Content }}</body>")
+        self.assertListEqual(
+            dependencies,
+            [self.path("page.html"), self.path("partials", "nav.html"), self.path("partials", "logo.html")],
+        )
+
+    def test_repeated_partial_listed_once(self):
+        write(self.path("page.html"), "{{> a.html }}{{> a.html }}")
+        write(self.path("a.html"), "a")
+        text, dependencies = load_template(self.path("page.html"))
+        self.assertEqual(text, "aa")
+        self.assertEqual(len(dependencies), 2)
+
+    def test_recursive_partial_raises(self):
+        write(self.path("page.html"), "{{> page.html }}")
+        with self.assertRaises(ValueError):
+            load_template(self.path("page.html"))
+
+
+class TestHashFiles(unittest.TestCase):
+    def test_hash_changes_with_content(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a = os.path.join(tmp, "a")
+            write(a, "one")
+            first = hash_files([a])
+            self.assertEqual(first, hash_files([a]))
+            write(a, "two")
+            self.assertNotEqual(first, hash_files([a]))
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    def test_segments(self):
+        template = CompiledTemplate("<title>{{ Title }}</title><body>{{Content}}</body>")
+        self.assertEqual(template.literals, ("<title>", "</title><body>", "</body>"))
+        self.assertEqual(template.slots, ("Title", "Content"))
+
+    def test_render(self):
+        template = CompiledTemplate("<h1>{{ Title }}</h1>{{ Content }}{{ Title }}")
+        self.assertEqual(template.render({"Title": "T", "Content": "<p>c</p>"}), "<h1>T</h1><p>c</p>T")
+
+    def test_slot_values_are_not_rescanned(self):
+        template = CompiledTemplate("{{ Title }}|{{ Content }}")
+        self.assertEqual(template.render({"Title": "{{ Content }}", "Content": "c"}), "{{ Content }}|c")
+
+    def test_missing_slot_left_as_written(self):
+        template = CompiledTemplate("{{ Title }} {{  Other }}")
+        self.assertEqual(template.render({"Title": "T"}), "T {{  Other }}")
+
+    def test_no_slots(self):
+        self.assertEqual(CompiledTemplate("static").render({}), "static")
+
+    def test_streams_html_nodes(self):
+        template = CompiledTemplate("<main>{{ Content }}</main>")
+        content = ParentNode("div", [LeafNode("p", "a"), LeafNode("p", "b")])
+        self.assertListEqual(
+            list(template.iter_render({"Content": content})),
+            ["<main>", "<div>", "<p>a</p>", "<p>b</p>", "</div>", "</main>"],
+        )
+        out = io.StringIO()
+        template.write_to(out, {"Content": content})
+        self.assertEqual(out.getvalue(), "<main><div><p>a</p><p>b</p></div></main>")
+
+
+class TestCompileTemplate(unittest.TestCase):
+    def test_cached_until_a_dependency_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            page = os.path.join(tmp, "page.html")
+            nav = os.path.join(tmp, "nav.html")
+            write(page, "{{> nav.html }}{{ Content }}")
+            write(nav, "<nav>")
+            first = compile_template(page)
+            self.assertIs(compile_template(page), first)
+            write(nav, "<nav class='x'>")
+            second = compile_template(page)
+            self.assertIsNot(second, first)
+            self.assertEqual(second.render({"Content": "c"}), "<nav class='x'>c")
+            self.assertListEqual(second.dependencies, [page, nav])
+
+
+if __name__ == "__main__":
+    unittest.main()
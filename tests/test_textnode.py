@@ -1,5 +1,6 @@
 import unittest
-from src.textnode import TextNode, TextType
+import pickle
+from src.textnode import TextNode, TextType, FrozenTextNode, SpanTextNode
 
 
 class TestTextNode(unittest.TestCase):
@@ -51,6 +52,74 @@ class TestTextNode(unittest.TestCase):
         node = TextNode("Hello", TextType.BOLD)
         self.assertNotEqual(node, "not a text node")
 
+    def test_no_instance_dict(self):
+        node = TextNode("Hello", TextType.BOLD)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
+
+class TestFrozenTextNode(unittest.TestCase):
+    def test_hashable_and_equal(self):
+        node1 = FrozenTextNode("Hello", TextType.LINK, "https://a.com")
+        node2 = FrozenTextNode("Hello", TextType.LINK, "https://a.com")
+        self.assertEqual(hash(node1), hash(node2))
+        self.assertEqual(len({node1, node2}), 1)
+
+    def test_equal_to_mutable_node(self):
+        self.assertEqual(FrozenTextNode("Hello", TextType.BOLD), TextNode("Hello", TextType.BOLD))
+        self.assertNotEqual(FrozenTextNode("Hello", TextType.BOLD), TextNode("Hello", TextType.ITALIC))
+
+    def test_immutable(self):
+        node = FrozenTextNode("Hello", TextType.BOLD)
+        with self.assertRaises(AttributeError):
+            node.text = "World"
+        with self.assertRaises(AttributeError):
+            del node.url
+
+    def test_repr(self):
+        self.assertEqual(repr(FrozenTextNode("Hello", TextType.BOLD)), "TextNode(Hello, bold, None)")
+
+    def test_pickle_roundtrip(self):
+        node = FrozenTextNode("Hello", TextType.LINK, "https://a.com")
+        self.assertEqual(pickle.loads(pickle.dumps(node)), node)
+
+
+
+class TestSpanTextNode(unittest.TestCase):
+    def test_text_is_slice_of_source(self):
+        node = SpanTextNode("xxHelloyy", 2, 7, TextType.BOLD)
+        self.assertEqual(node.text, "Hello")
+
+    def test_no_text_slot_of_its_own(self):
+        node = SpanTextNode("xxHelloyy", 2, 7, TextType.BOLD)
+        self.assertEqual(SpanTextNode.__slots__, ("start", "end"))
+        self.assertEqual(node.source, "xxHelloyy")
+        self.assertFalse(hasattr(node, "__dict__"))
+
+    def test_empty_span_is_truthy(self):
+        self.assertTrue(SpanTextNode("abc", 1, 1, TextType.TEXT))
+
+    def test_pickle_roundtrip(self):
+        node = SpanTextNode("see [docs](/d)", 5, 9, TextType.LINK, "/d")
+        copy = pickle.loads(pickle.dumps(node))
+        self.assertIsInstance(copy, SpanTextNode)
+        self.assertEqual(copy, node)
+
+    def test_equal_to_text_node(self):
+        node = SpanTextNode("see [docs](/d)", 5, 9, TextType.LINK, "/d")
+        self.assertEqual(node, TextNode("docs", TextType.LINK, "/d"))
+        self.assertEqual(TextNode("docs", TextType.LINK, "/d"), node)
+        self.assertNotEqual(node, TextNode("docs", TextType.LINK, "/e"))
+
+    def test_repr(self):
+        self.assertEqual(repr(SpanTextNode("_hi_", 1, 3, TextType.ITALIC)), "TextNode(hi, italic, None)")
+
+    def test_set_text(self):
+        node = SpanTextNode("abcdef", 1, 3, TextType.TEXT)
+        node.text = "xyz"
+        self.assertEqual((node.text, node.start, node.end), ("xyz", 0, 3))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest 
 from src.textnode import TextNode, TextType
-from src.util_functions import text_node_to_html_node, split_nodes_delimiter, extract_markdown_images, extract_markdown_links, split_nodes_image, split_nodes_link
+from src.parentnode import ParentNode
+from src.util_functions import text_node_to_html_node, text_nodes_to_html_nodes, split_nodes_delimiter, extract_markdown_images, extract_markdown_links, extract_markdown_image_spans, extract_markdown_link_spans, split_nodes_image, split_nodes_link
 
 
 class TestTexNodeToHTMLNode(unittest.TestCase):
@@ -84,6 +85,44 @@ class TestTexNodeToHTMLNode(unittest.TestCase):
                 else:
                     self.assertEqual(html_node.props, expected_props)
 
+class TestTextNodesToHTMLNodes(unittest.TestCase):
+    def test_matches_single_conversion(self):
+        nodes = [
+            TextNode("Plain", TextType.TEXT),
+            TextNode("Bold", TextType.BOLD),
+            TextNode("Link", TextType.LINK, "https://example.com"),
+            TextNode("Alt", TextType.IMAGE, "img.png"),
+        ]
+        converted = list(text_nodes_to_html_nodes(nodes))
+        for text_node, html_node in zip(nodes, converted):
+            expected = text_node_to_html_node(text_node)
+            self.assertEqual(
+                (html_node.tag, html_node.value, html_node.props),
+                (expected.tag, expected.value, expected.props),
+            )
+        self.assertEqual(len(converted), len(nodes))
+
+    def test_is_lazy(self):
+        def source():
+            yield TextNode("a", TextType.TEXT)
+            raise AssertionError("consumed too far")
+
+        html_nodes = text_nodes_to_html_nodes(source())
+        self.assertEqual(next(html_nodes).value, "a")
+
+    def test_feeds_parent_node(self):
+        nodes = [TextNode("Hello ", TextType.TEXT), TextNode("world", TextType.ITALIC)]
+        parent = ParentNode("p", text_nodes_to_html_nodes(nodes))
+        self.assertEqual(parent.to_html(), "<p>Hello <i>world</i></p>")
+
+    def test_invalid_type(self):
+        class FakeTextType:
+            pass
+
+        with self.assertRaises(Exception) as context:
+            list(text_nodes_to_html_nodes([TextNode("Invalid", FakeTextType())]))
+        self.assertIn("Invalid TextType", str(context.exception))
+
 class TestSplitNodesDelimiter(unittest.TestCase):
 
     def test_basic_code_split(self):
@@ -252,6 +291,22 @@ class TestMarkdownExtraction(unittest.TestCase):
             extract_markdown_images(text), [("image", "https://img.com")]
         )
 
+class TestMarkdownSpanExtraction(unittest.TestCase):
+    def test_image_spans(self):
+        text = "a ![one](u1) b ![](u2)"
+        spans = extract_markdown_image_spans(text)
+        self.assertListEqual(spans, [(2, 12, "one", "u1"), (15, 22, "", "u2")])
+        for start, end, alt, url in spans:
+            self.assertEqual(text[start:end], f"![{alt}]({url})")
+
+    def test_link_spans_skip_images(self):
+        text = "![img](a) [link](b)"
+        self.assertListEqual(extract_markdown_link_spans(text), [(10, 19, "link", "b")])
+
+    def test_no_brackets(self):
+        self.assertListEqual(extract_markdown_image_spans("no images here!"), [])
+        self.assertListEqual(extract_markdown_link_spans("no links here"), [])
+
 class TestSplitNodesImage(unittest.TestCase):
 
     def test_single_image(self):